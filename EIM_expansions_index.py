@@ -0,0 +1,538 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EIM Compiled Expansions Index
+Compiles EXPANSIONS_DATA into a compact binary file and reads it through mmap
+
+The file holds a minimal perfect hash over the abbreviations plus a packed
+UTF-8 string table. Readers map the file and decode only the entries they
+look up, so startup cost and memory stay flat as the dictionary grows, and
+every process using the index shares the same pages through the page cache.
+
+Only the lower-case canonical entries are stored; capitalized variants are
+derived from the CASE_RULES in EIM_expansions_data.py when they are looked up.
+Each entry also records the source section (and namespace) it came from.
+
+Usage:
+python3 EIM_expansions_index.py            # build EIM_expansions.bin
+python3 EIM_expansions_index.py out.bin    # build to a specific path
+"""
+
+import mmap
+import os
+import struct
+import sys
+import time
+from collections.abc import Mapping
+from functools import lru_cache
+from itertools import accumulate, chain
+from operator import add
+from hashlib import blake2b
+from pathlib import Path
+
+INDEX_MAGIC = b"EIMX"
+INDEX_VERSION = 4
+DEFAULT_INDEX_PATH = Path(__file__).with_name("EIM_expansions.bin")
+
+# magic, version, case rule count, entry count, option count, section count,
+# string table offset
+HEADER = struct.Struct("<4sHHIIII")
+# Displacement per hash bucket (negative values encode a direct slot)
+DISPLACEMENT = struct.Struct("<i")
+# String table offset, key length, value length
+RECORD = struct.Struct("<IHH")
+# Section number of each entry, in slot order
+SECTION_ID = struct.Struct("<H")
+NO_SECTION = 0xFFFF
+# Namespace for entries that are not in any source section
+DEFAULT_NAMESPACE = "Other"
+# Displacements tried before every slot of a bucket is shifted by one
+SEEDS_PER_SHIFT = 64
+
+
+def _hash(key):
+    """Split one 96-bit hash of a UTF-8 key into (bucket, base, step)"""
+    h = int.from_bytes(blake2b(key, digest_size=12).digest(), "little")
+    # The step is odd so different displacements move keys to different slots
+    return h & 0xFFFFFFFF, (h >> 32) & 0xFFFFFFFF, (h >> 64) | 1
+
+
+def _slot(base, step, displacement, size):
+    """Slot for a key in a displaced bucket
+
+    A step that shares a factor with the table size only cycles through part
+    of the table, so every `size` displacements also shift the slot by one.
+    """
+    return (base + displacement * step + displacement // size) % size
+
+
+def _displace(members, size, occupied):
+    """Find the first displacement that puts a bucket's keys in free slots
+
+    members: [(base, step), ...]. The slot expression is _slot() inlined,
+    which matters when a large dictionary is compiled.
+    """
+    is_occupied = occupied.__getitem__
+    count = len(members)
+    for shift in range(size):
+        first = shift * size
+        if first + SEEDS_PER_SHIFT > 0x7FFFFFFF:
+            break
+        for seed in range(first, first + SEEDS_PER_SHIFT):
+            offset = seed // size
+            placed = [(base + seed * step + offset) % size for base, step in members]
+            if not any(map(is_occupied, placed)) and len(set(placed)) == count:
+                return seed, placed
+    raise ValueError("Could not build a perfect hash for the expansions")
+
+
+def _build_perfect_hash(keys):
+    """Hash-and-displace: return (displacements, slot of each key)"""
+    size = len(keys)
+    # The same 96-bit hash as _hash(), kept whole and split below
+    hashes = [int.from_bytes(blake2b(key, digest_size=12).digest(), "little") for key in keys]
+    buckets = {}
+    for index, h in enumerate(hashes):
+        bucket = (h & 0xFFFFFFFF) % size
+        members = buckets.get(bucket)
+        if members is None:
+            buckets[bucket] = index
+        elif isinstance(members, int):
+            buckets[bucket] = [members, index]
+        else:
+            members.append(index)
+
+    displacements = [0] * size
+    slots = [0] * size
+    occupied = bytearray(size)
+
+    # Place the largest buckets first while the table is still empty;
+    # single-key buckets are stored as a bare index rather than a list
+    multi = [bucket for bucket in buckets.items() if isinstance(bucket[1], list)]
+    multi.sort(key=lambda bucket: len(bucket[1]), reverse=True)
+    for bucket, members in multi:
+        seed, placed = _displace(
+            [((hashes[index] >> 32) & 0xFFFFFFFF, (hashes[index] >> 64) | 1) for index in members],
+            size, occupied)
+
+        displacements[bucket] = seed
+        for index, slot in zip(members, placed):
+            slots[index] = slot
+            occupied[slot] = 1
+
+    # Single-key buckets point straight at a free slot
+    free = [slot for slot, used in enumerate(occupied) if not used]
+    for bucket, index in buckets.items():
+        if isinstance(index, int):
+            slot = free.pop()
+            displacements[bucket] = -slot - 1
+            slots[index] = slot
+
+    return displacements, slots
+
+
+def build_index(expansions, options=None, rules=None, output_path=DEFAULT_INDEX_PATH,
+                sections=None):
+    """Compile an expansions dict (with hotstring options and case rules) into an index file
+
+    sections: optional [(title, namespace, [abbreviation, ...]), ...]
+    """
+    options = options or {}
+    rules = rules or {}
+    sections = sections or []
+    if len(sections) >= NO_SECTION:
+        raise ValueError("Too many sections for the index")
+    keys = [key.encode("utf-8") for key in expansions]
+    values = [value.encode("utf-8") for value in expansions.values()]
+    displacements, slots = _build_perfect_hash(keys)
+
+    # Key and value bytes are stored back to back in slot order
+    order = sorted(range(len(keys)), key=slots.__getitem__)
+
+    section_of = {}
+    for number, (_, _, members) in enumerate(sections):
+        for abbreviation in members:
+            section_of[abbreviation] = number
+    abbreviations = list(expansions)
+    section_ids = [section_of.get(abbreviations[index], NO_SECTION) for index in order]
+
+    # Options, case rules and section titles are small key/value tables stored after the entries
+    record_keys = [keys[index] for index in order]
+    record_values = [values[index] for index in order]
+    for table in (options, rules, {title: namespace for title, namespace, _ in sections}):
+        record_keys.extend(key.encode("utf-8") for key in table)
+        record_values.extend(value.encode("utf-8") for value in table.values())
+
+    # Built with list-wide operations rather than a loop per record, which
+    # keeps compiling a dictionary of 100k entries well under a second
+    key_lengths = list(map(len, record_keys))
+    value_lengths = list(map(len, record_values))
+    for key, key_length, value_length in zip(record_keys, key_lengths, value_lengths):
+        if key_length > 0xFFFF or value_length > 0xFFFF:
+            raise ValueError(f"Entry too long for the index: {key[:40]!r}")
+    offsets = accumulate(map(add, key_lengths, value_lengths), initial=0)
+    records = chain.from_iterable(zip(offsets, key_lengths, value_lengths))
+
+    strings_offset = (HEADER.size + DISPLACEMENT.size * len(keys) + RECORD.size * len(record_keys)
+                      + SECTION_ID.size * len(keys))
+    data = b"".join([
+        HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(rules), len(keys),
+                    len(options), len(sections), strings_offset),
+        struct.pack(f"<{len(displacements)}i", *displacements),
+        struct.pack("<" + "IHH" * len(record_keys), *records),
+        struct.pack(f"<{len(section_ids)}H", *section_ids),
+        b"".join(chain.from_iterable(zip(record_keys, record_values))),
+    ])
+
+    # Write next to the target and rename, so readers never map a partial file
+    output_path = Path(output_path)
+    temp_path = output_path.with_name(output_path.name + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, output_path)
+    return len(data)
+
+
+class ExpansionIndex(Mapping):
+    """Read-only mapping over a compiled index file"""
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, rule_count, self._count, option_count, section_count,
+         self._strings) = HEADER.unpack_from(self._map, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            self._map.close()
+            raise ValueError(f"Not an EIM expansions index: {self.path}")
+
+        self._records = HEADER.size + DISPLACEMENT.size * self._count
+        extra_records = self._records + RECORD.size * self._count
+        extra = [
+            self._entry(extra_records + RECORD.size * index)
+            for index in range(option_count + rule_count + section_count)
+        ]
+        self.options = dict(extra[:option_count])
+        self.rules = dict(extra[option_count:option_count + rule_count])
+        # [(title, namespace), ...] in source order
+        self.section_titles = extra[option_count + rule_count:]
+        self._section_ids = extra_records + RECORD.size * len(extra)
+
+    def _key(self, record_offset):
+        """Decode only the key stored in one record"""
+        offset, key_length, _ = RECORD.unpack_from(self._map, record_offset)
+        start = self._strings + offset
+        return self._map[start:start + key_length].decode("utf-8")
+
+    def _entry(self, record_offset):
+        """Decode the (key, value) pair stored in one record"""
+        offset, key_length, value_length = RECORD.unpack_from(self._map, record_offset)
+        start = self._strings + offset
+        key = self._map[start:start + key_length]
+        value = self._map[start + key_length:start + key_length + value_length]
+        return key.decode("utf-8"), value.decode("utf-8")
+
+    def lookup(self, abbreviation):
+        """Return the expansion for an abbreviation, or None"""
+        if not self._count:
+            return None
+        key = abbreviation.encode("utf-8")
+
+        bucket, base, step = _hash(key)
+        displacement, = DISPLACEMENT.unpack_from(
+            self._map, HEADER.size + DISPLACEMENT.size * (bucket % self._count))
+        if displacement < 0:
+            slot = -displacement - 1
+        else:
+            slot = _slot(base, step, displacement, self._count)
+
+        offset, key_length, value_length = RECORD.unpack_from(
+            self._map, self._records + RECORD.size * slot)
+        start = self._strings + offset
+        # Keys outside the dictionary still hash to some slot, so compare
+        if key_length != len(key) or self._map[start:start + key_length] != key:
+            return None
+        return self._map[start + key_length:start + key_length + value_length].decode("utf-8")
+
+    def get(self, abbreviation, default=None):
+        expansion = self.lookup(abbreviation)
+        return default if expansion is None else expansion
+
+    def __getitem__(self, abbreviation):
+        expansion = self.lookup(abbreviation)
+        if expansion is None:
+            raise KeyError(abbreviation)
+        return expansion
+
+    def __contains__(self, abbreviation):
+        return isinstance(abbreviation, str) and self.lookup(abbreviation) is not None
+
+    def __iter__(self):
+        for slot in range(self._count):
+            yield self._key(self._records + RECORD.size * slot)
+
+    def items(self):
+        """Iterate (abbreviation, expansion) pairs without repeated hashing"""
+        return (self._entry(self._records + RECORD.size * slot) for slot in range(self._count))
+
+    def __len__(self):
+        return self._count
+
+    def read_sections(self):
+        """[(title, namespace, [abbreviation, ...]), ...] read from the entries
+
+        Decodes every key, so callers should only ask when they need the sections.
+        """
+        members = [[] for _ in self.section_titles]
+        ids = struct.unpack_from(f"<{self._count}H", self._map, self._section_ids)
+        for abbreviation, number in zip(self, ids):
+            if number != NO_SECTION:
+                members[number].append(abbreviation)
+        return [(title, namespace, keys) for (title, namespace), keys in zip(self.section_titles, members)]
+
+    def close(self):
+        """Unmap the index file"""
+        self._map.close()
+
+
+class CaseVariantMapping(Mapping):
+    """Canonical expansions plus capitalized variants derived from case rules"""
+
+    def __init__(self, expansions, rules=None, options=None, cache_size=1024, sections=None):
+        self.expansions = expansions
+        self.rules = rules or {}
+        self.options = options or {}
+        # [(title, namespace, [canonical abbreviation, ...]), ...], or a function
+        # returning them that is only called when the sections are first needed
+        self._sections = sections
+        self._length = None
+
+        # Longest prefixes first, and variant prefixes grouped by first character
+        self._rules = sorted(self.rules.items(), key=lambda rule: -len(rule[0]))
+        self._variants = {}
+        for lower, upper in sorted(self.rules.items(), key=lambda rule: -len(rule[1])):
+            self._variants.setdefault(upper[:1], []).append((upper, lower))
+
+        if cache_size:
+            self.lookup = lru_cache(maxsize=cache_size)(self.lookup)
+
+    @property
+    def sections(self):
+        if callable(self._sections):
+            self._sections = self._sections()
+        return self._sections or []
+
+    def lookup(self, abbreviation):
+        """Return the expansion for an abbreviation or its capitalized variant, or None"""
+        expansion = self.expansions.get(abbreviation)
+        if expansion is not None:
+            return expansion
+
+        for upper, lower in self._variants.get(abbreviation[:1], ()):
+            if not abbreviation.startswith(upper):
+                continue
+            canonical = lower + abbreviation[len(upper):]
+            if canonical in self.options:
+                continue
+            expansion = self.expansions.get(canonical)
+            if expansion is not None:
+                return capitalize(expansion)
+        return None
+
+    def variant(self, abbreviation):
+        """Return the capitalized variant of a canonical abbreviation, or None"""
+        if abbreviation in self.options:
+            return None
+        for lower, upper in self._rules:
+            if abbreviation.startswith(lower):
+                return upper + abbreviation[len(lower):]
+        return None
+
+    def __getitem__(self, abbreviation):
+        expansion = self.lookup(abbreviation) if isinstance(abbreviation, str) else None
+        if expansion is None:
+            raise KeyError(abbreviation)
+        return expansion
+
+    def get(self, abbreviation, default=None):
+        expansion = self.lookup(abbreviation) if isinstance(abbreviation, str) else None
+        return default if expansion is None else expansion
+
+    def __contains__(self, abbreviation):
+        return isinstance(abbreviation, str) and self.lookup(abbreviation) is not None
+
+    def items(self):
+        """Iterate (abbreviation, expansion) pairs, variants after their canonical entry"""
+        for abbreviation, expansion in self.expansions.items():
+            yield abbreviation, expansion
+            variant = self.variant(abbreviation)
+            # Explicit entries win over derived variants
+            if variant and variant not in self.expansions:
+                yield variant, capitalize(expansion)
+
+    def __iter__(self):
+        """Iterate abbreviations in items() order without decoding any expansion"""
+        for abbreviation in self.expansions:
+            yield abbreviation
+            variant = self.variant(abbreviation)
+            if variant and variant not in self.expansions:
+                yield variant
+
+    def __len__(self):
+        if self._length is None:
+            self._length = sum(1 for _ in self)
+        return self._length
+
+
+class CategoryIndex:
+    """Abbreviations grouped by namespace and source section, built once per dictionary"""
+
+    def __init__(self, expansions):
+        # {namespace: {section title: [abbreviation, ...]}}, variants included
+        self.namespaces = {}
+        self.sections = {}
+        listed = set()
+        variant = getattr(expansions, "variant", lambda abbreviation: None)
+        canonical = getattr(expansions, "expansions", expansions)
+
+        for title, namespace, members in getattr(expansions, "sections", []):
+            abbreviations = []
+            for abbreviation in members:
+                abbreviations.append(abbreviation)
+                capitalized = variant(abbreviation)
+                if capitalized and capitalized not in canonical:
+                    abbreviations.append(capitalized)
+            listed.update(abbreviations)
+            self.namespaces.setdefault(namespace, {})[title] = abbreviations
+            self.sections[title] = abbreviations
+
+        # Anything not covered by a section (custom entries, older data files)
+        unlisted = [abbreviation for abbreviation in expansions if abbreviation not in listed]
+        if unlisted:
+            self.namespaces.setdefault(DEFAULT_NAMESPACE, {})[DEFAULT_NAMESPACE] = unlisted
+            self.sections.setdefault(DEFAULT_NAMESPACE, unlisted)
+
+        self._counts = {
+            namespace: sum(len(members) for members in sections.values())
+            for namespace, sections in self.namespaces.items()
+        }
+
+    def counts(self):
+        """{namespace: number of abbreviations}"""
+        return dict(self._counts)
+
+    def entries(self, name):
+        """Abbreviations in a namespace or a section (case-insensitive name), or None"""
+        for namespace, sections in self.namespaces.items():
+            if namespace.lower() == name.lower():
+                return [abbreviation for members in sections.values() for abbreviation in members]
+        for title, members in self.sections.items():
+            if title.lower() == name.lower():
+                return list(members)
+        return None
+
+
+def capitalize(text):
+    """Upper-case the first letter only ("oh my god" -> "Oh my god")"""
+    return text[:1].upper() + text[1:]
+
+
+def _source_path():
+    """Locate EIM_expansions_data.py without importing it"""
+    import importlib.util
+    spec = importlib.util.find_spec("EIM_expansions_data")
+    return Path(spec.origin) if spec and spec.origin else None
+
+
+def dictionary_paths(index_path=DEFAULT_INDEX_PATH):
+    """Files load_expansions() reads, for watching them for changes"""
+    source = _source_path()
+    return [path for path in (source, Path(index_path)) if path is not None]
+
+
+def _data_sections(expansions_data, sections):
+    """Turn the data file's (title, namespace, first abbreviation) list into member lists
+
+    A section runs from its first abbreviation up to the next section's, so
+    entries added or removed by hand stay in the section they were put in.
+    """
+    abbreviations = list(expansions_data)
+    starts = []
+    for title, namespace, first in sections:
+        if first is None:
+            starts.append(None)
+        elif first in expansions_data:
+            starts.append(abbreviations.index(first))
+        else:
+            raise ValueError(
+                f"section {title!r} starts at {first!r}, which is not in EXPANSIONS_DATA; "
+                "rerun compile_expansions.py"
+            )
+    bounds = [start for start in starts if start is not None] + [len(abbreviations)]
+    if (len(bounds) > 1 and bounds[0] != 0) or bounds != sorted(bounds):
+        raise ValueError("SECTIONS is out of order with EXPANSIONS_DATA; rerun compile_expansions.py")
+    result = []
+    following = iter(bounds[1:])
+    for (title, namespace, _), start in zip(sections, starts):
+        members = [] if start is None else abbreviations[start:next(following)]
+        result.append((title, namespace, members))
+    return result
+
+
+def _load_data_file(path=None):
+    """Return (expansions, options, rules, sections) from the data file
+
+    With a path the file is run in a fresh namespace (a syntax error raises
+    SyntaxError); without one the already imported module is used.
+    """
+    if path is None:
+        import EIM_expansions_data
+        namespace = vars(EIM_expansions_data)
+    else:
+        namespace = {}
+        exec(compile(path.read_bytes(), str(path), "exec"), namespace)
+    expansions_data = namespace["EXPANSIONS_DATA"]
+    sections = _data_sections(expansions_data, namespace.get("SECTIONS", []))
+    return expansions_data, namespace["HOTSTRING_OPTIONS"], namespace["CASE_RULES"], sections
+
+
+def load_expansions(index_path=DEFAULT_INDEX_PATH, reload=False):
+    """Return (expansions, options), from the compiled index when it is up to date
+
+    With reload=True the data file is read from disk again instead of reusing
+    the already imported module, so edits made since startup are picked up.
+    """
+    source = _source_path()
+    try:
+        index_path = Path(index_path)
+        if index_path.exists() and (source is None
+                                    or index_path.stat().st_mtime >= source.stat().st_mtime):
+            index = ExpansionIndex(index_path)
+            return CaseVariantMapping(index, index.rules, index.options,
+                                      sections=index.read_sections), index.options
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not use compiled expansions index: {e}")
+
+    # Fall back to the Python data file (raises ImportError if it is missing)
+    expansions_data, hotstring_options, case_rules, sections = _load_data_file(
+        source if reload and source is not None else None)
+    return CaseVariantMapping(expansions_data, case_rules, hotstring_options,
+                              sections=sections), hotstring_options
+
+
+def main():
+    """Compile EIM_expansions_data.py into the binary index"""
+    EXPANSIONS_DATA, HOTSTRING_OPTIONS, CASE_RULES, sections = _load_data_file()
+
+    output_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_INDEX_PATH
+    start = time.perf_counter()
+    size = build_index(EXPANSIONS_DATA, HOTSTRING_OPTIONS, CASE_RULES, output_path, sections)
+    elapsed = time.perf_counter() - start
+
+    print(f"Compiled {len(EXPANSIONS_DATA)} expansions into {output_path}")
+    print(f"Index size: {size} bytes, built in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
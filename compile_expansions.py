@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EIM Expansions Compiler
+Generates every platform artifact from the single canonical source file
+
+Source:
+- EIM_expansions_source.ahk - AutoHotkey hotstring syntax (":C:aomg::oh my god")
+  plus directives that AutoHotkey treats as comments:
+  ";@section <title>" starts a section, ";@namespace <name>" tags the sections
+  that follow (untagged sections are their own namespace),
+  ";@case <prefix> <PREFIX>" adds a case rule,
+  ";@note <text>" is a comment about the source itself that the outputs leave out
+
+Outputs:
+- EIM_expansions_data.py          - Python data used by the Linux scripts
+- EIM_expansions.bin              - compiled, memory-mapped index
+- EIM.ahk                         - Windows AutoHotkey script (replacements escaped
+                                    so AutoHotkey types them as written)
+- linux/autokey_scripts/          - one AutoKey script per abbreviation
+
+Outputs are only rewritten when their content changes, and nothing is parsed
+at all when the source is unchanged since the last build. Duplicate and
+conflicting hotstrings are reported while parsing; conflicts stop the build.
+
+Usage:
+python3 compile_expansions.py           # rebuild changed outputs
+python3 compile_expansions.py --force   # rebuild every output
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from json.encoder import encode_basestring
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+SOURCE_FILE = ROOT / "EIM_expansions_source.ahk"
+STATE_FILE = ROOT / ".eim_build_state.json"
+DATA_FILE = ROOT / "EIM_expansions_data.py"
+INDEX_FILE = ROOT / "EIM_expansions.bin"
+AHK_FILE = ROOT / "EIM.ahk"
+AUTOKEY_DIR = ROOT / "linux" / "autokey_scripts"
+
+# The AutoKey script template lives next to the other Linux tools
+sys.path.insert(0, str(ROOT / "linux"))
+
+# Bump when the rendering below changes so existing outputs are rebuilt
+COMPILER_VERSION = 5
+
+# Hotstring options the Linux tools understand; "C" is the default
+SUPPORTED_OPTIONS = set("?C")
+DEFAULT_OPTIONS = "C"
+
+HOTSTRING = re.compile(r":([^:]*):(.+?)::(.*)")
+
+# Replacements in the source are plain text. In EIM.ahk, Send would read
+# !+^#{} as keys, ` as the escape character and " ;" as a comment
+AHK_ESCAPES = str.maketrans({
+    **{char: "{" + char + "}" for char in "!+^#{}"},
+    "`": "``",
+    ";": "`;",
+})
+
+
+class ExpansionSource:
+    """Parsed canonical source: sections, entries, options and case rules"""
+
+    def __init__(self):
+        self.preamble = []
+        # [title, notes, [(trigger, replacement), ...], namespace]
+        self.sections = []
+        self.expansions = {}
+        self.options = {}
+        self.case_rules = {}
+        # {trigger: capitalized variant} for variants not listed explicitly
+        self.variants = {}
+        self.warnings = []
+        self.errors = []
+        self._lines = {}
+        self._prefix_lengths = []
+
+    def parse(self, text, filename=SOURCE_FILE.name):
+        """Parse hotstring source text, collecting warnings and errors"""
+        section = None
+        namespace = None
+        expansions = self.expansions
+        for line_number, line in enumerate(text.splitlines(), 1):
+            line = line.rstrip()
+            where = (filename, line_number)
+
+            if not line:
+                continue
+            if line[0] == ":":
+                match = HOTSTRING.fullmatch(line)
+                if not match:
+                    self.errors.append(f"{location(where)}: not a hotstring: {line}")
+                    continue
+                if section is None:
+                    section = ["Expansions", [], [], namespace or "Expansions"]
+                    self.sections.append(section)
+                options, trigger, replacement = match.groups()
+                # Plain ":C:" hotstrings seen for the first time are nearly every
+                # line, so they skip the checks in _add()
+                if options == DEFAULT_OPTIONS and trigger not in expansions:
+                    expansions[trigger] = replacement
+                    self._lines[trigger] = where
+                    section[2].append((trigger, replacement))
+                else:
+                    self._add(section, where, options, trigger, replacement)
+            elif line.startswith(";@section"):
+                title = line[len(";@section"):].strip()
+                section = [title, [], [], namespace or title]
+                self.sections.append(section)
+            elif line.startswith(";@namespace"):
+                namespace = line[len(";@namespace"):].strip() or None
+            elif line.startswith(";@note"):
+                continue
+            elif line.startswith(";@case"):
+                parts = line.split()
+                if len(parts) != 3 or parts[1].lower() != parts[1]:
+                    self.errors.append(f"{location(where)}: expected ';@case <prefix> <PREFIX>'")
+                else:
+                    self.case_rules[parts[1]] = parts[2]
+            elif line.startswith(";"):
+                (section[1] if section else self.preamble).append(line[1:])
+            else:
+                self.errors.append(f"{location(where)}: not a hotstring: {line}")
+
+    def _add(self, section, where, options, trigger, replacement):
+        if options != DEFAULT_OPTIONS:
+            unsupported = set(options) - SUPPORTED_OPTIONS
+            if unsupported:
+                self.warnings.append(f"{location(where)}: ignoring unsupported options "
+                                     f"'{''.join(sorted(unsupported))}' for {trigger}")
+            options = "".join(option for option in options if option in SUPPORTED_OPTIONS)
+
+        if trigger in self.expansions:
+            first = location(self._lines[trigger])
+            if self.expansions[trigger] == replacement and self.options.get(trigger, DEFAULT_OPTIONS) == options:
+                self.warnings.append(f"{location(where)}: duplicate of {trigger} ({first})")
+            else:
+                self.errors.append(f"{location(where)}: conflicts with {trigger} ({first}): "
+                                   f"'{replacement}' vs '{self.expansions[trigger]}'")
+            return
+
+        self.expansions[trigger] = replacement
+        self._lines[trigger] = where
+        if options != DEFAULT_OPTIONS:
+            self.options[trigger] = options
+        section[2].append((trigger, replacement))
+
+    def check_case_rules(self):
+        """Derive the capitalized variants once, reporting explicit entries that repeat one"""
+        self._prefix_lengths = sorted({len(lower) for lower in self.case_rules}, reverse=True)
+        for trigger, replacement in self.expansions.items():
+            variant = self.variant(trigger)
+            if variant is None:
+                continue
+            if variant not in self.expansions:
+                self.variants[trigger] = variant
+            elif self.expansions[variant] == capitalize(replacement):
+                self.warnings.append(f"{location(self._lines[variant])}: {variant} is already "
+                                     f"derived from {trigger} by a case rule")
+
+    def variant(self, trigger):
+        """Capitalized variant of a trigger according to the case rules, or None"""
+        if trigger in self.options:
+            return None
+        # Longest prefix first; at most one rule can match per prefix length
+        for length in self._prefix_lengths:
+            upper = self.case_rules.get(trigger[:length])
+            if upper is not None:
+                return upper + trigger[length:]
+        return None
+
+    def with_variants(self):
+        """Every expansion, capitalized variants included"""
+        expansions = dict(self.expansions)
+        for trigger, variant in self.variants.items():
+            expansions[variant] = capitalize(self.expansions[trigger])
+        return expansions
+
+
+def location(where):
+    """Format a (filename, line number) pair for messages"""
+    return f"{where[0]}:{where[1]}"
+
+
+def capitalize(text):
+    """Upper-case the first letter only"""
+    return text[:1].upper() + text[1:]
+
+
+def quote(text):
+    """Double-quoted Python string literal, matching the hand-written data file"""
+    return encode_basestring(text)
+
+
+def render_data(source):
+    """Render EIM_expansions_data.py"""
+    lines = [
+        "#!/usr/bin/env python3",
+        "# -*- coding: utf-8 -*-",
+        '"""',
+        "EIM Expansions Data File",
+        f"Generated by compile_expansions.py from {SOURCE_FILE.name} - do not edit by hand",
+        '"""',
+        "",
+        "# Text expansions data (capitalized variants come from CASE_RULES below)",
+        "EXPANSIONS_DATA = {",
+    ]
+    for index, (title, notes, entries, namespace) in enumerate(source.sections):
+        if index:
+            lines.append("")
+        lines.append(f"    # {title}")
+        lines.extend(f"    # {note}" for note in notes)
+        lines.extend(f"    {quote(trigger)}: {quote(replacement)}," for trigger, replacement in entries)
+    lines += [
+        "}",
+        "",
+        "# Capitalized variants resolved at lookup time instead of stored as twins:",
+        "# an abbreviation starting with the upper-case prefix looks up the lower-case",
+        "# entry and capitalizes the first letter of its expansion",
+        '# ("Aomg" -> "Oh my god", "LAinre" -> "In reference to the matter of").',
+        '# Explicit entries such as "Afaik" take precedence over the rules.',
+        "CASE_RULES = {",
+    ]
+    lines.extend(f"    {quote(lower)}: {quote(upper)}," for lower, upper in source.case_rules.items())
+    lines += [
+        "}",
+        "",
+        '# AutoHotkey hotstring options for entries that are not plain ":C:" hotstrings',
+        '# "?" = expand inside a word, "C" = case-sensitive',
+        "HOTSTRING_OPTIONS = {",
+    ]
+    lines.extend(f"    {quote(trigger)}: {quote(options)}," for trigger, options in source.options.items())
+    lines += [
+        "}",
+        "",
+        "# Source sections in EXPANSIONS_DATA order: (title, namespace, first abbreviation)",
+        "SECTIONS = [",
+    ]
+    lines.extend(
+        f"    ({quote(title)}, {quote(namespace)}, {quote(entries[0][0]) if entries else None}),"
+        for title, notes, entries, namespace in source.sections
+    )
+    lines.append("]")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def render_ahk(source):
+    """Render EIM.ahk with every capitalized variant spelled out"""
+    lines = [f";{line}" for line in source.preamble]
+    lines.append(f";Generated by compile_expansions.py from {SOURCE_FILE.name} - do not edit by hand")
+    for title, notes, entries, namespace in source.sections:
+        lines.append("")
+        lines.append(f";{title}")
+        lines.extend(f";{note}" for note in notes)
+        for trigger, replacement in entries:
+            options = source.options.get(trigger, DEFAULT_OPTIONS)
+            lines.append(f":{options}:{trigger}::{replacement.translate(AHK_ESCAPES)}")
+            variant = source.variants.get(trigger)
+            if variant:
+                lines.append(f":{options}:{variant}::{capitalize(replacement).translate(AHK_ESCAPES)}")
+    # UTF-8 with BOM so AutoHotkey v1 reads the non-ASCII region names correctly
+    return ("\r\n".join(lines) + "\r\n").encode("utf-8-sig")
+
+
+def render_index(source):
+    """Render the compiled index through EIM_expansions_index"""
+    from EIM_expansions_index import build_index
+    temp_path = INDEX_FILE.with_name(INDEX_FILE.name + ".build")
+    try:
+        sections = [
+            (title, namespace, [trigger for trigger, _ in entries])
+            for title, notes, entries, namespace in source.sections
+        ]
+        build_index(source.expansions, source.options, source.case_rules, temp_path, sections)
+        return temp_path.read_bytes()
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+def render_autokey(source):
+    """Render the AutoKey scripts as {filename: content}"""
+    from create_autokey_scripts import script_files
+
+    return {
+        filename: content.encode("utf-8")
+        for filename, content in script_files(source.with_variants())
+    }
+
+
+def digest(data):
+    """Content hash used for change detection"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_atomic(path, data):
+    """Write a file through a temporary name so readers never see it half written"""
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def load_state():
+    """Load the hashes recorded by the previous build"""
+    try:
+        with open(STATE_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state):
+    """Record the source and output hashes of this build"""
+    try:
+        with open(STATE_FILE, "w") as f:
+            json.dump(state, f, indent=2)
+    except OSError as e:
+        print(f"Warning: Could not save build state: {e}")
+
+
+def file_digest(path):
+    """Hash of a file on disk, or None if it does not exist"""
+    try:
+        return digest(path.read_bytes())
+    except OSError:
+        return None
+
+
+def outputs_current(state, source_hash):
+    """True when the source and every output match the previous build"""
+    if state.get("source") != source_hash or state.get("compiler") != COMPILER_VERSION:
+        return False
+    outputs = state.get("outputs", {})
+    for path in (DATA_FILE, INDEX_FILE, AHK_FILE):
+        if file_digest(path) != outputs.get(path.name):
+            return False
+    return index_fresh() and AUTOKEY_DIR.is_dir()
+
+
+def index_fresh():
+    """True when the index is not older than the data file
+
+    load_expansions() ignores an index older than the data file, so an index
+    with the right content but an older timestamp still needs rewriting.
+    """
+    try:
+        return INDEX_FILE.stat().st_mtime >= DATA_FILE.stat().st_mtime
+    except OSError:
+        return False
+
+
+def main():
+    """Compile the canonical source into every platform artifact"""
+    force = "--force" in sys.argv[1:]
+    start = time.perf_counter()
+
+    source_bytes = SOURCE_FILE.read_bytes()
+    source_hash = digest(source_bytes + str(COMPILER_VERSION).encode())
+    state = load_state()
+
+    if not force and outputs_current(state, source_hash):
+        print(f"All outputs up to date ({(time.perf_counter() - start) * 1000:.1f} ms)")
+        return 0
+
+    source = ExpansionSource()
+    source.parse(source_bytes.decode("utf-8"))
+    source.check_case_rules()
+    for warning in source.warnings:
+        print(f"Warning: {warning}")
+    for error in source.errors:
+        print(f"Error: {error}")
+    if source.errors:
+        print(f"✗ {len(source.errors)} error(s), no outputs written")
+        return 1
+
+    parsed = time.perf_counter()
+    print(f"Parsed {len(source.expansions)} expansions in {len(source.sections)} sections "
+          f"({(parsed - start) * 1000:.1f} ms)")
+
+    new_state = {"source": source_hash, "compiler": COMPILER_VERSION, "outputs": {}}
+    data_written = False
+    for path, render in ((DATA_FILE, render_data), (INDEX_FILE, render_index), (AHK_FILE, render_ahk)):
+        step = time.perf_counter()
+        data = render(source)
+        content_hash = digest(data)
+        new_state["outputs"][path.name] = content_hash
+        # Writing the data file always rewrites the index after it (see index_fresh())
+        stale_index = path == INDEX_FILE and (data_written or not index_fresh())
+        if force or stale_index or file_digest(path) != content_hash:
+            write_atomic(path, data)
+            data_written = data_written or path == DATA_FILE
+            status = "written"
+        else:
+            status = "unchanged"
+        print(f"  {path.relative_to(ROOT)}: {status} ({(time.perf_counter() - step) * 1000:.1f} ms)")
+
+    # The scripts only depend on the source, and the manifest in the directory
+    # tracks the individual files, so they are skipped when the source is unchanged
+    step = time.perf_counter()
+    if force or state.get("source") != source_hash or not AUTOKEY_DIR.is_dir():
+        from create_autokey_scripts import sync_scripts
+        files = render_autokey(source)
+        written, removed, _ = sync_scripts(files, AUTOKEY_DIR, force=force)
+        status = f"{written} of {len(files)} written, {removed} removed"
+    else:
+        status = "unchanged"
+    print(f"  {AUTOKEY_DIR.relative_to(ROOT)}/: {status} ({(time.perf_counter() - step) * 1000:.1f} ms)")
+
+    save_state(new_state)
+    print(f"✓ Build finished in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,10 +18,10 @@ import autokey.common
 import autokey.configmanager.configmanager
 import autokey.scripting
 
-# Import the expansions data from the separate file
+# Import the expansions data (compiled index when available)
 try:
-    from EIM_expansions_data import EXPANSIONS_DATA
-    EXPANSIONS = EXPANSIONS_DATA
+    from EIM_expansions_index import load_expansions
+    EXPANSIONS, _ = load_expansions()
 except ImportError:
     # Fallback data if import fails
     EXPANSIONS = {
@@ -10,262 +10,43 @@ Usage:
 1. Run this script: python create_autokey_scripts.py
 2. It will create a folder called "autokey_scripts" with individual scripts
 3. Copy each script to AutoKey and set the appropriate abbreviation
+
+Or build a ready-to-install AutoKey folder instead:
+python create_autokey_scripts.py --bundle
+This writes "autokey_bundle/EIM", one dispatcher script whose metadata lists
+every abbreviation, and the expansion table it reads. Copy that folder into ~/.config/autokey/data/ and restart
+AutoKey - no per-abbreviation setup needed.
+
+Reruns are incremental: a manifest in the output folder records the content
+hash of every generated script, so only added or changed scripts are written
+and scripts for removed abbreviations are deleted.
 """
 
+import hashlib
+import json
 import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-# All your text expansions from EIM.ahk
-EXPANSIONS = {
-    # Text abbreviation expansions
-    "aomg": "oh my god",
-    "Aomg": "Oh my god",
-    "abtw": "by the way",
-    "Abtw": "By the way",
-    "aidk": "i don't know",
-    "Aidk": "I don't know",
-    "aimho": "in my humble opinion",
-    "Aimho": "In my humble opinion",
-    "afyi": "for your information",
-    "Afyi": "For your information",
-    "aasap": "as soon as possible",
-    "Aasap": "As soon as possible",
-    "alol": "laugh out loud",
-    "Alol": "Laugh out loud",
-    "abrb": "be right back",
-    "Abrb": "Be right back",
-    "attyl": "talk to you later",
-    "Attyl": "Talk to you later",
-    "aty": "thank you",
-    "Aty": "Thank you",
-    "afaik": "as far as i know",
-    "Afaik": "As far as I know",
-    
-    # Legal phrase expansions
-    "lainre": "in reference to the matter of",
-    "LAinre": "In reference to the matter of",
-    "lahere": "subject to the provisions hereof",
-    "LAhere": "Subject to the provisions hereof",
-    "lawith": "without prejudice to the foregoing",
-    "LAwith": "Without prejudice to the foregoing",
-    "laprior": "prior to the execution hereof",
-    "LAprior": "Prior to the execution hereof",
-    "laterm": "for the term set forth herein",
-    "LAterm": "For the term set forth herein",
-    "labreach": "in the event of any breach thereof",
-    "LAbreach": "In the event of any breach thereof",
-    "lalaw": "pursuant to applicable law",
-    "LAlaw": "Pursuant to applicable law",
-    "laagree": "for and in consideration of the mutual covenants",
-    "LAagree": "For and in consideration of the mutual covenants",
-    "lareg": "in accordance with applicable regulations",
-    "LAreg": "In accordance with applicable regulations",
-    "lacomp": "in compliance with all relevant requirements",
-    "LAcomp": "In compliance with all relevant requirements",
-    "laconf": "subject to confidentiality obligations",
-    "LAconf": "Subject to confidentiality obligations",
-    "laliab": "shall not be liable for any damages arising from",
-    "LAliab": "Shall not be liable for any damages arising from",
-    "lawar": "represents and warrants that",
-    "LAwar": "Represents and warrants that",
-    "laind": "shall indemnify and hold harmless",
-    "LAind": "Shall indemnify and hold harmless",
-    "lasev": "if any provision is found to be invalid or unenforceable",
-    "LAsev": "If any provision is found to be invalid or unenforceable",
-    
-    # Word expansions
-    "1wdh": "downhill",
-    "1Wdh": "Downhill",
-    "1wuh": "uphill",
-    "1Wuh": "Uphill",
-    "1wnb": "northbound",
-    "1Wnb": "Northbound",
-    "1wsb": "southbound",
-    "1Wsb": "Southbound",
-    "1web": "eastbound",
-    "1Web": "Eastbound",
-    "1wwb": "westbound",
-    "1Wwb": "Westbound",
-    
-    # US states and territories
-    "USal": "Alabama", "USak": "Alaska", "USaz": "Arizona",
-    "USar": "Arkansas", "USca": "California", "USco": "Colorado",
-    "USct": "Connecticut", "USde": "Delaware", "USfl": "Florida",
-    "USga": "Georgia", "UShi": "Hawaii", "USid": "Idaho",
-    "USil": "Illinois", "USin": "Indiana", "USia": "Iowa",
-    "USks": "Kansas", "USky": "Kentucky", "USla": "Louisiana",
-    "USme": "Maine", "USmd": "Maryland", "USma": "Massachusetts",
-    "USmi": "Michigan", "USmn": "Minnesota", "USms": "Mississippi",
-    "USmo": "Missouri", "USmt": "Montana", "USne": "Nebraska",
-    "USnv": "Nevada", "USnh": "New Hampshire", "USnj": "New Jersey",
-    "USnm": "New Mexico", "USny": "New York", "USnc": "North Carolina",
-    "USnd": "North Dakota", "USoh": "Ohio", "USok": "Oklahoma",
-    "USor": "Oregon", "USpa": "Pennsylvania", "USri": "Rhode Island",
-    "USsc": "South Carolina", "USsd": "South Dakota", "UStn": "Tennessee",
-    "UStx": "Texas", "USut": "Utah", "USvt": "Vermont",
-    "USva": "Virginia", "USwa": "Washington", "USwv": "West Virginia",
-    "USwi": "Wisconsin", "USwy": "Wyoming", "USdc": "District of Columbia",
-    "USas": "American Samoa", "USgu": "Guam", "USmp": "Northern Mariana Islands",
-    "USpr": "Puerto Rico", "USvi": "U.S. Virgin Islands",
-    
-    # Canadian provinces and territories
-    "CAab": "Alberta", "CAbc": "British Columbia", "CAmb": "Manitoba",
-    "CAnb": "New Brunswick", "CAnl": "Newfoundland and Labrador",
-    "CAns": "Nova Scotia", "CAnt": "Northwest Territories",
-    "CAnu": "Nunavut", "CAon": "Ontario", "CApe": "Prince Edward Island",
-    "CAqc": "Quebec", "CAsk": "Saskatchewan", "CAyt": "Yukon",
-    
-    # Australian states and territories
-    "AUact": "Australian Capital Territory", "AUnt": "Northern Territory",
-    "AUnsw": "New South Wales", "AUqld": "Queensland",
-    "AUsa": "South Australia", "AUtas": "Tasmania",
-    "AUvic": "Victoria", "AUwa": "Western Australia",
-    
-    # German federal states
-    "DEbw": "Baden-Württemberg", "DEby": "Bavaria", "DEbe": "Berlin",
-    "DEbb": "Brandenburg", "DEhb": "Bremen", "DEhh": "Hamburg",
-    "DEhe": "Hesse", "DEMV": "Mecklenburg-Vorpommern", "DEni": "Lower Saxony",
-    "DEnw": "North Rhine-Westphalia", "DErp": "Rhineland-Palatinate",
-    "DEsl": "Saarland", "DEsn": "Saxony", "DEst": "Saxony-Anhalt",
-    "DESH": "Schleswig-Holstein", "DEth": "Thuringia",
-    
-    # Country codes
-    "ccaf": "Afghanistan", "ccal": "Albania", "ccdz": "Algeria",
-    "ccad": "Andorra", "ccao": "Angola", "ccag": "Antigua and Barbuda",
-    "ccar": "Argentina", "ccam": "Armenia", "ccau": "Australia",
-    "ccat": "Austria", "ccaz": "Azerbaijan", "ccbs": "Bahamas",
-    "ccbh": "Bahrain", "ccbd": "Bangladesh", "ccbb": "Barbados",
-    "ccby": "Belarus", "ccbe": "Belgium", "ccbz": "Belize",
-    "ccbj": "Benin", "ccbt": "Bhutan", "ccbo": "Bolivia",
-    "ccba": "Bosnia and Herzegovina", "ccbw": "Botswana", "ccbr": "Brazil",
-    "ccbn": "Brunei", "ccbg": "Bulgaria", "ccbf": "Burkina Faso",
-    "ccbi": "Burundi", "cckh": "Cambodia", "cccm": "Cameroon",
-    "ccca": "Canada", "cccv": "Cape Verde", "cccf": "Central African Republic",
-    "cctd": "Chad", "cccl": "Chile", "cccn": "China",
-    "ccco": "Colombia", "cckm": "Comoros", "cccg": "Congo",
-    "cccr": "Costa Rica", "cchr": "Croatia", "cccu": "Cuba",
-    "cccy": "Cyprus", "cccz": "Czech Republic", "cccd": "Democratic Republic of the Congo",
-    "ccdk": "Denmark", "ccdj": "Djibouti", "ccdm": "Dominica",
-    "ccdo": "Dominican Republic", "ccec": "Ecuador", "cceg": "Egypt",
-    "ccsv": "El Salvador", "ccgq": "Equatorial Guinea", "ccer": "Eritrea",
-    "ccee": "Estonia", "ccet": "Ethiopia", "ccfj": "Fiji",
-    "ccfi": "Finland", "ccfr": "France", "ccga": "Gabon",
-    "ccgm": "Gambia", "ccge": "Georgia", "ccde": "Germany",
-    "ccgh": "Ghana", "ccgr": "Greece", "ccgd": "Grenada",
-    "ccgt": "Guatemala", "ccgn": "Guinea", "ccgw": "Guinea-Bissau",
-    "ccgy": "Guyana", "ccht": "Haiti", "cchn": "Honduras",
-    "cchu": "Hungary", "ccis": "Iceland", "ccin": "India",
-    "ccid": "Indonesia", "ccir": "Iran", "cciq": "Iraq",
-    "ccie": "Ireland", "ccil": "Israel", "ccit": "Italy",
-    "cciv": "Ivory Coast", "ccjm": "Jamaica", "ccjp": "Japan",
-    "ccjo": "Jordan", "cckz": "Kazakhstan", "ccke": "Kenya",
-    "ccki": "Kiribati", "ccxk": "Kosovo", "cckw": "Kuwait",
-    "cckg": "Kyrgyzstan", "ccla": "Laos", "cclv": "Latvia",
-    "cclb": "Lebanon", "ccls": "Lesotho", "cclr": "Liberia",
-    "ccly": "Libya", "ccli": "Liechtenstein", "cclt": "Lithuania",
-    "cclu": "Luxembourg", "ccmk": "Macedonia", "ccmg": "Madagascar",
-    "ccmw": "Malawi", "ccmy": "Malaysia", "ccmv": "Maldives",
-    "ccml": "Mali", "ccmt": "Malta", "ccmh": "Marshall Islands",
-    "ccmr": "Mauritania", "ccmu": "Mauritius", "ccmx": "Mexico",
-    "ccfm": "Micronesia", "ccmd": "Moldova", "ccmc": "Monaco",
-    "ccmn": "Mongolia", "ccme": "Montenegro", "ccma": "Morocco",
-    "ccmz": "Mozambique", "ccmm": "Myanmar", "ccna": "Namibia",
-    "ccnr": "Nauru", "ccnp": "Nepal", "ccnl": "Netherlands",
-    "ccnz": "New Zealand", "ccni": "Nicaragua", "ccne": "Niger",
-    "ccng": "Nigeria", "cckp": "North Korea", "ccno": "Norway",
-    "ccom": "Oman", "ccpk": "Pakistan", "ccpw": "Palau",
-    "ccps": "Palestine", "ccpa": "Panama", "ccpg": "Papua New Guinea",
-    "ccpy": "Paraguay", "ccpe": "Peru", "ccph": "Philippines",
-    "ccpl": "Poland", "ccpt": "Portugal", "ccqa": "Qatar",
-    "ccro": "Romania", "ccru": "Russia", "ccrw": "Rwanda",
-    "cckn": "Saint Kitts and Nevis", "cclc": "Saint Lucia",
-    "ccvc": "Saint Vincent and the Grenadines", "ccws": "Samoa",
-    "ccsm": "San Marino", "ccst": "Sao Tome and Principe", "ccsa": "Saudi Arabia",
-    "ccsn": "Senegal", "ccrs": "Serbia", "ccsc": "Seychelles",
-    "ccsl": "Sierra Leone", "ccsg": "Singapore", "ccsk": "Slovakia",
-    "ccsi": "Slovenia", "ccsb": "Solomon Islands", "ccso": "Somalia",
-    "ccza": "South Africa", "cckr": "South Korea", "ccss": "South Sudan",
-    "cces": "Spain", "cclk": "Sri Lanka", "ccsd": "Sudan",
-    "ccsr": "Suriname", "ccsz": "Eswatini", "ccse": "Sweden",
-    "ccch": "Switzerland", "ccsy": "Syria", "cctw": "Taiwan",
-    "cctj": "Tajikistan", "cctz": "Tanzania", "ccth": "Thailand",
-    "cctl": "Timor-Leste", "cctg": "Togo", "ccto": "Tonga",
-    "cctt": "Trinidad and Tobago", "cctn": "Tunisia", "cctr": "Turkey",
-    "cctm": "Turkmenistan", "cctv": "Tuvalu", "ccug": "Uganda",
-    "ccua": "Ukraine", "ccae": "United Arab Emirates", "ccgb": "England",
-    "ccwl": "Wales", "ccscot": "Scotland", "ccuk": "Northern Ireland",
-    "ccus": "United States", "ccuy": "Uruguay", "ccuz": "Uzbekistan",
-    "ccvu": "Vanuatu", "ccva": "Vatican City", "ccve": "Venezuela",
-    "ccvn": "Vietnam", "ccye": "Yemen", "cczm": "Zambia",
-    "cczw": "Zimbabwe",
-    
-    # Nationalities
-    "pccaf": "Afghan", "pccal": "Albanian", "pccdz": "Algerian",
-    "pccad": "Andorran", "pccao": "Angolan", "pccag": "Antiguan",
-    "pccar": "Argentine", "pccam": "Armenian", "pccau": "Australian",
-    "pccat": "Austrian", "pccaz": "Azerbaijani", "pccbs": "Bahamian",
-    "pccbh": "Bahraini", "pccbd": "Bangladeshi", "pccbb": "Barbadian",
-    "pccby": "Belarusian", "pccbe": "Belgian", "pccbz": "Belizean",
-    "pccbj": "Beninese", "pccbt": "Bhutanese", "pccbo": "Bolivian",
-    "pccba": "Bosnian", "pccbw": "Botswanan", "pccbr": "Brazilian",
-    "pccbn": "Bruneian", "pccbg": "Bulgarian", "pccbf": "Burkinabe",
-    "pccbi": "Burundian", "pcckh": "Cambodian", "pcccm": "Cameroonian",
-    "pccca": "Canadian", "pcccv": "Cape Verdean", "pcccf": "Central African",
-    "pcctd": "Chadian", "pcccl": "Chilean", "pcccn": "Chinese",
-    "pccco": "Colombian", "pcckm": "Comorian", "pcccg": "Congolese",
-    "pcccd": "Congolese", "pcccr": "Costa Rican", "pcchr": "Croatian",
-    "pcccu": "Cuban", "pcccy": "Cypriot", "pcccz": "Czech",
-    "pccdk": "Danish", "pccdj": "Djiboutian", "pccdm": "Dominican",
-    "pccdo": "Dominican", "pccec": "Ecuadorian", "pcceg": "Egyptian",
-    "pccsv": "Salvadoran", "pccgq": "Equatorial Guinean", "pccer": "Eritrean",
-    "pccee": "Estonian", "pccet": "Ethiopian", "pccfj": "Fijian",
-    "pccfi": "Finnish", "pccfr": "French", "pccga": "Gabonese",
-    "pccgm": "Gambian", "pccge": "Georgian", "pccde": "German",
-    "pccgh": "Ghanaian", "pccgr": "Greek", "pccgd": "Grenadian",
-    "pccgt": "Guatemalan", "pccgn": "Guinean", "pccgw": "Guinea-Bissauan",
-    "pccgy": "Guyanese", "pccht": "Haitian", "pcchn": "Honduran",
-    "pcchu": "Hungarian", "pccis": "Icelandic", "pccin": "Indian",
-    "pccid": "Indonesian", "pccir": "Iranian", "pcciq": "Iraqi",
-    "pccie": "Irish", "pccil": "Israeli", "pccit": "Italian",
-    "pcciv": "Ivorian", "pccjm": "Jamaican", "pccjp": "Japanese",
-    "pccjo": "Jordanian", "pcckz": "Kazakhstani", "pccke": "Kenyan",
-    "pccki": "I-Kiribati", "pccxk": "Kosovar", "pcckw": "Kuwaiti",
-    "pcckg": "Kyrgyzstani", "pccla": "Laotian", "pcclv": "Latvian",
-    "pcclb": "Lebanese", "pccls": "Lesothan", "pcclr": "Liberian",
-    "pccly": "Libyan", "pccli": "Liechtensteiner", "pcclt": "Lithuanian",
-    "pcclu": "Luxembourger", "pccmk": "Macedonian", "pccmg": "Malagasy",
-    "pccmw": "Malawian", "pccmy": "Malaysian", "pccmv": "Maldivian",
-    "pccml": "Malian", "pccmt": "Maltese", "pccmh": "Marshallese",
-    "pccmr": "Mauritanian", "pccmu": "Mauritian", "pccmx": "Mexican",
-    "pccfm": "Micronesian", "pccmd": "Moldovan", "pccmc": "Monacan",
-    "pccmn": "Mongolian", "pccme": "Montenegro", "pccma": "Moroccan",
-    "pccmz": "Mozambican", "pccmm": "Myanmar", "pccna": "Namibian",
-    "pccnr": "Nauruan", "pccnp": "Nepalese", "pccnl": "Dutch",
-    "pccnz": "New Zealander", "pccni": "Nicaraguan", "pccne": "Nigerien",
-    "pccng": "Nigerian", "pcckp": "North Korean", "pccno": "Norwegian",
-    "pccom": "Omani", "pccpk": "Pakistani", "pccpw": "Palauan",
-    "pccps": "Palestinian", "pccpa": "Panamanian", "pccpg": "Papua New Guinean",
-    "pccpy": "Paraguayan", "pccpe": "Peruvian", "pccph": "Filipino",
-    "pccpl": "Polish", "pccpt": "Portuguese", "pccqa": "Qatari",
-    "pccro": "Romanian", "pccru": "Russian", "pccrw": "Rwandan",
-    "pcckn": "Kittitian", "pcclc": "Saint Lucian", "pccvc": "Vincentian",
-    "pccws": "Samoan", "pccsm": "Sammarinese", "pccst": "Sao Tomean",
-    "pccsa": "Saudi Arabian", "pccsn": "Senegalese", "pccrs": "Serbian",
-    "pccsc": "Seychellois", "pccsl": "Sierra Leonean", "pccsg": "Singaporean",
-    "pccsk": "Slovak", "pccsi": "Slovenian", "pccsb": "Solomon Islander",
-    "pccso": "Somali", "pccza": "South African", "pcckr": "South Korean",
-    "pccss": "South Sudanese", "pcces": "Spanish", "pcclk": "Sri Lankan",
-    "pccsd": "Sudanese", "pccsr": "Surinamese", "pccsz": "Swazi",
-    "pccse": "Swedish", "pccch": "Swiss", "pccsy": "Syrian",
-    "pcctw": "Taiwanese", "pcctj": "Tajik", "pcctz": "Tanzanian",
-    "pccth": "Thai", "pcctl": "Timorese", "pcctg": "Togolese",
-    "pccto": "Tongan", "pcctt": "Trinidadian", "pcctn": "Tunisian",
-    "pcctr": "Turkish", "pcctm": "Turkmen", "pcctv": "Tuvaluan",
-    "pccug": "Ugandan", "pccua": "Ukrainian", "pccae": "Emirati",
-    "pccgb": "English", "pccwh": "Welsh", "pccscot": "Scotland",
-    "pccuk": "Northern Irish", "pccus": "United States", "pccuy": "Uruguayan",
-    "pccuz": "Uzbek", "pccvu": "Vanuatuan", "pccva": "Vatican",
-    "pccve": "Venezuelan", "pccvn": "Vietnamese", "pccye": "Yemeni",
-    "pcczm": "Zambian", "pcczw": "Zimbabwean",
+# Expansions come from the shared data file in the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+OUTPUT_DIR = Path(__file__).resolve().parent / "autokey_scripts"
+BUNDLE_DIR = Path(__file__).resolve().parent / "autokey_bundle" / "EIM"
+MANIFEST_NAME = ".manifest.json"
+# Every bundle abbreviation and its expansion, read by the dispatcher scripts
+TABLE_NAME = "eim_expansions.json"
+
+# AutoKey item metadata shared by the bundle folder and its scripts
+ABBREVIATION_DEFAULTS = {
+    "abbreviations": [],
+    "backspace": True,
+    "ignoreCase": False,
+    "immediate": False,
+    "triggerInside": False,
+    "wordChars": "[\\w]",
 }
 
 def create_script_content(abbreviation, expansion):
@@ -286,27 +67,183 @@ keyboard.send_keys("<delete>")  # Delete the selection
 keyboard.send_text("{expansion}")
 '''
 
+def script_filename(abbreviation):
+    """Create filename (replace special characters)"""
+    return f"{abbreviation.replace(':', '_').replace('<', '_').replace('>', '_')}.py"
+
+def script_files(expansions):
+    """Yield (filename, content) for every abbreviation"""
+    for abbreviation, expansion in expansions.items():
+        yield script_filename(abbreviation), create_script_content(abbreviation, expansion)
+
+def create_dispatcher_content():
+    """Create the AutoKey script that expands every abbreviation in the bundle
+
+    AutoKey compiles and runs a script on every trigger, so the expansions are
+    not inlined: they live in TABLE_NAME beside the script, are parsed on the
+    first trigger and stay cached in sys.modules until the file changes.
+    """
+    return f'''# -*- coding: utf-8 -*-
+"""
+EIM dispatcher for AutoKey (generated by create_autokey_scripts.py --bundle)
+
+AutoKey triggers this script for every abbreviation listed in its metadata
+and has already removed the typed abbreviation; look it up and type the
+expansion. The table in {TABLE_NAME} is read once and cached for the
+lifetime of AutoKey, so a trigger costs one stat() and one dict lookup.
+"""
+
+import json
+import os
+import sys
+import types
+
+# AutoKey compiles scripts with their path as the file name
+folder = os.path.dirname(sys._getframe().f_code.co_filename)
+if not os.path.isfile(os.path.join(folder, "{TABLE_NAME}")):
+    folder = os.path.expanduser("~/.config/autokey/data/EIM")
+table_path = os.path.join(folder, "{TABLE_NAME}")
+
+cache = sys.modules.get("eim_autokey_table")
+modified = os.stat(table_path).st_mtime_ns
+if cache is None or cache.modified != modified:
+    cache = types.ModuleType("eim_autokey_table")
+    with open(table_path, encoding="utf-8") as f:
+        cache.EXPANSIONS = json.load(f)
+    cache.modified = modified
+    sys.modules["eim_autokey_table"] = cache
+
+abbreviation, _ = engine.get_triggered_abbreviation()
+expansion = cache.EXPANSIONS.get(abbreviation)
+if expansion is not None:
+    keyboard.send_keys(expansion)
+'''
+
+def create_metadata(title, abbreviations=(), trigger_inside=False, ignore_case=False):
+    """Create AutoKey .json metadata for the bundle folder or one dispatcher script"""
+    metadata = {
+        "type": "script" if abbreviations else "folder",
+        "description" if abbreviations else "title": title,
+        "modes": [1] if abbreviations else [],
+        "usageCount": 0,
+        "showInTrayMenu": False,
+        "abbreviation": dict(
+            ABBREVIATION_DEFAULTS,
+            abbreviations=sorted(abbreviations),
+            triggerInside=trigger_inside,
+            ignoreCase=ignore_case,
+        ),
+        "hotkey": {"modifiers": [], "hotKey": None},
+        "filter": {"regex": None, "isRecursive": False},
+    }
+    if abbreviations:
+        metadata.update({"store": {}, "prompt": False, "omitTrigger": False})
+    return json.dumps(metadata, indent=4, ensure_ascii=False) + "\n"
+
+def bundle_files(expansions, options=None):
+    """Yield (filename, content) for the AutoKey folder bundle
+
+    AutoKey settings such as "trigger inside word" apply per script, so
+    hotstrings are grouped by their options with one dispatcher per group.
+    """
+    options = options or {}
+    groups = {}
+    for abbreviation, expansion in expansions.items():
+        hotstring_options = options.get(abbreviation, "C")
+        key = ("?" in hotstring_options, "C" not in hotstring_options)
+        groups.setdefault(key, {})[abbreviation] = expansion
+
+    yield ".folder.json", create_metadata("EIM")
+    yield TABLE_NAME, json.dumps(dict(sorted(expansions.items())), ensure_ascii=False, indent=0) + "\n"
+    for (trigger_inside, ignore_case), group in sorted(groups.items()):
+        name = "eim_dispatcher"
+        if trigger_inside:
+            name += "_inword"
+        if ignore_case:
+            name += "_nocase"
+        yield f"{name}.py", create_dispatcher_content()
+        yield f".{name}.json", create_metadata(
+            f"EIM expansions ({len(group)})", group, trigger_inside, ignore_case)
+
+def load_manifest(manifest_path):
+    """Load {filename: content hash} recorded by the previous run"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def write_script(path, content):
+    """Write one script through a temporary name and an atomic rename"""
+    temp_path = path.with_name(f".{path.name}.tmp")
+    with open(temp_path, 'wb') as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+def sync_scripts(files, output_dir=OUTPUT_DIR, workers=None, manifest_path=None, force=False):
+    """Bring output_dir in line with {filename: content bytes}
+
+    force rewrites every file instead of trusting the manifest.
+    Returns (written, removed, unchanged) counts.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = manifest_path or output_dir / MANIFEST_NAME
+    manifest = load_manifest(manifest_path)
+    on_disk = set(os.listdir(output_dir))
+
+    hashes = {filename: hashlib.sha256(content).hexdigest() for filename, content in files.items()}
+    if force:
+        changed = set(hashes)
+    else:
+        # Set operations on the dict views rather than a Python loop per file
+        changed = {filename for filename, _ in hashes.items() - manifest.items()}
+        changed |= hashes.keys() - on_disk
+    # Only delete files this generator created, never unrelated user files
+    stale = (manifest.keys() - hashes.keys()) & on_disk
+
+    if changed:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # list() re-raises the first write error, if any
+            list(pool.map(lambda filename: write_script(output_dir / filename, files[filename]), changed))
+    for filename in stale:
+        try:
+            os.remove(output_dir / filename)
+        except OSError as e:
+            print(f"Warning: Could not remove {filename}: {e}")
+
+    if changed or stale or manifest != hashes:
+        write_script(Path(manifest_path),
+                     json.dumps(hashes, indent=0, sort_keys=True).encode('utf-8'))
+    return len(changed), len(stale), len(files) - len(changed)
+
 def main():
     """Generate all individual AutoKey scripts"""
+    start = time.perf_counter()
+    try:
+        from EIM_expansions_index import load_expansions
+        expansions, options = load_expansions()
+    except ImportError:
+        print("Error: EIM_expansions_data.py not found in the repository root")
+        sys.exit(1)
     
-    # Create output directory
-    output_dir = "autokey_scripts"
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    if "--bundle" in sys.argv[1:]:
+        files = {filename: content.encode('utf-8') for filename, content in bundle_files(expansions, options)}
+        # The manifest sits beside the folder so AutoKey never sees it
+        written, removed, unchanged = sync_scripts(
+            files, BUNDLE_DIR, manifest_path=BUNDLE_DIR.with_name(f".{BUNDLE_DIR.name}{MANIFEST_NAME}"))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"Generated AutoKey bundle for {len(expansions)} abbreviations in '{BUNDLE_DIR}'")
+        print(f"  {written} written, {removed} removed, {unchanged} unchanged ({elapsed_ms:.1f} ms)")
+        print("\nTo install: copy the folder to ~/.config/autokey/data/ and restart AutoKey")
+        return
     
-    # Generate scripts for each abbreviation
-    for abbreviation, expansion in EXPANSIONS.items():
-        # Create filename (replace special characters)
-        filename = f"{abbreviation.replace(':', '_').replace('<', '_').replace('>', '_')}.py"
-        filepath = os.path.join(output_dir, filename)
-        
-        # Write script content
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(create_script_content(abbreviation, expansion))
-        
-        print(f"Created: {filename}")
+    files = {filename: content.encode('utf-8') for filename, content in script_files(expansions)}
+    written, removed, unchanged = sync_scripts(files)
     
-    print(f"\nGenerated {len(EXPANSIONS)} AutoKey scripts in '{output_dir}' folder")
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"Generated {len(files)} AutoKey scripts in '{OUTPUT_DIR}' folder")
+    print(f"  {written} written, {removed} removed, {unchanged} unchanged ({elapsed_ms:.1f} ms)")
     print("\nTo use these scripts:")
     print("1. Open AutoKey")
     print("2. Create a new Script (not Phrase)")
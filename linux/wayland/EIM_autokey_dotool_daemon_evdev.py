@@ -6,7 +6,8 @@ Enhanced background monitoring with direct keyboard input detection
 
 Requirements:
 - Python 3.6+
-- dotool (Wayland keyboard simulation tool)
+- dotool (Wayland keyboard simulation tool), or write access to /dev/uinput
+  with "injection_backend": "uinput"
 - evdev (Linux input device monitoring)
 - EIM_expansions_data.py (data file)
 
@@ -20,18 +21,25 @@ Usage:
 python3 EIM_autokey_dotool_daemon_evdev.py &
 # or
 nohup python3 EIM_autokey_dotool_daemon_evdev.py > /dev/null 2>&1 &
+# time each startup phase, then exit
+python3 EIM_autokey_dotool_daemon_evdev.py --profile-startup
 """
 
-import subprocess
 import sys
 import time
+
+# Start of the "imports" startup phase
+IMPORT_START = time.perf_counter()
+
 import threading
 import signal
 import os
 import json
+import queue
+import selectors
+import shutil
+import fnmatch
 from pathlib import Path
-from datetime import datetime
-from collections import deque
 
 # Try to import evdev, fall back to clipboard monitoring if not available
 try:
@@ -42,42 +50,135 @@ except ImportError:
     print("Warning: evdev not available. Install with: pip3 install evdev")
     print("Falling back to clipboard monitoring only.")
 
-# Import the expansions data
+# Import the expansions loader; the daemon loads the data (compiled index when available)
 try:
-    from EIM_expansions_data import EXPANSIONS_DATA
+    from EIM_expansions_index import load_expansions, dictionary_paths, CategoryIndex
 except ImportError:
     print("Error: EIM_expansions_data.py not found in the same directory")
     print("Please ensure the data file is present")
     sys.exit(1)
 
+from eim_injection import DotoolSession, UinputSession, UINPUT_DEVICE_NAME
+from eim_matcher import HotstringMatcher, TypingState
+from eim_inotify import (Inotify, IN_CLOSE_WRITE, IN_MOVED_TO, IN_ONLYDIR,
+                         IN_CREATE, IN_ATTRIB, IN_DELETE)
+from eim_latency import LatencyStats, StartupTimer
+from eim_history import ExpansionHistory, ExpansionLog
+from eim_keymap import KeyMap, ModifierState, DEFAULT_LAYOUT, STATES, MODIFIER_KEYS
+from eim_device_reader import DeviceReader
+from eim_clipboard import ClipboardWatcher, ClipboardPaster
+from eim_input_devices import list_input_devices, describe_device
+
+# Input device nodes, watched for keyboards being plugged in and removed
+INPUT_DIR = "/dev/input"
+
+IMPORT_END = time.perf_counter()
+
 class EIMDaemonEnhanced:
     def __init__(self, config_file="eim_config.json"):
+        # Time to ready, phase by phase (--profile-startup prints it)
+        self.startup = StartupTimer(IMPORT_START)
+        self.startup.mark("imports", IMPORT_END)
         self.running = True
+        self.paused = False
+        self.started_at = time.time()
+        # Set on shutdown so the main loop wakes up immediately
+        self.shutdown_event = threading.Event()
+        # Written once on shutdown and never drained, so every selector that
+        # registers the read end wakes up and its thread can block indefinitely
+        self.wakeup_pipe = os.pipe()
+        os.set_blocking(self.wakeup_pipe[1], False)
         self.last_clipboard = ""
-        self.expansion_history = []
-        self.max_history = 100
+        self.clipboard_watcher = None
         self.config_file = config_file
         self.config = self.load_config()
         
+        # Recent expansions as compact records, formatted only when shown
+        self.expansion_history = ExpansionHistory(
+            self.config.get("performance", {}).get("max_history_size", 100))
+        # Optional long-term log, written in batches off the injection path
+        self.expansion_log = None
+        if self.config["expansion_log_path"]:
+            self.expansion_log = ExpansionLog(
+                self.config["expansion_log_path"],
+                max_bytes=int(self.config["expansion_log_max_mb"] * 1024 * 1024),
+                backups=self.config["expansion_log_backups"])
+        
         # Keyboard monitoring
         self.keyboard_devices = []
-        self.current_abbreviation = ""
-        self.abbreviation_buffer = deque(maxlen=20)  # Store last 20 keystrokes
-        self.last_key_time = 0
+        # path -> DeviceReader, for the per-device event counters
+        self.device_readers = {}
+        self.monitored_key_codes = set()
+        # Each keyboard's reader holds its own TypingState; this one serves
+        # events that come from no reader (replayed events in the benchmark)
+        self.typing = TypingState()
         self.key_timeout = 2.0  # Reset abbreviation after 2 seconds of no input
+        # Keycode -> character table for the configured layout, indexed by modifier state
+        try:
+            self.keymap = KeyMap(self.config["keyboard_layout"])
+        except ValueError as e:
+            print(f"Warning: {e}; using {DEFAULT_LAYOUT}")
+            self.keymap = KeyMap(DEFAULT_LAYOUT)
+        self.modifiers = ModifierState()
+        self.startup.mark("config")
+        
+        # Whole-word and in-word hotstrings, matched one keystroke at a time;
+        # read-only, so every keyboard's TypingState shares it
+        try:
+            self.expansions, hotstring_options = load_expansions()
+        except ImportError:
+            print("Error: EIM_expansions_data.py not found in the same directory")
+            print("Please ensure the data file is present")
+            sys.exit(1)
+        except (SyntaxError, ValueError, KeyError) as e:
+            print(f"Error: EIM_expansions_data.py could not be loaded: {e!r}")
+            print("Fix the file by hand or rerun compile_expansions.py")
+            sys.exit(1)
+        self.matcher = HotstringMatcher(self.expansions, hotstring_options)
+        # Namespace counts and membership, built the first time they are asked for
+        self.categories = None
+        self.startup.mark("index build")
+        
+        # Hot reload: a rebuilt matcher waits here until the keyboard thread swaps it in
+        self.pending_matcher = None
+        self.reloads = 0
+        self.reload_failures = 0
+        self.last_reload_ms = 0.0
         
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
         
-        # Check dotool availability
-        if not self.check_dotool():
-            print("Error: dotool not available. Please install it first.")
-            sys.exit(1)
+        # Injection backend shared by every expansion: dotool or a uinput virtual keyboard
+        self.backend = self.create_backend()
+        
+        # Long expansions are pasted from the clipboard in one shortcut instead of typed
+        self.paster = None
+        if self.config["paste_threshold"] > 0:
+            paster = ClipboardPaster(self.config["paste_restore_delay_ms"] / 1000.0)
+            if not paster.available():
+                print("Warning: wl-copy/wl-paste or xclip not found; long expansions will be typed")
+            elif not self.paste_shortcut_valid():
+                print(f"Warning: paste_shortcut {self.config['paste_shortcut']!r} cannot be pressed "
+                      "on this keyboard layout; long expansions will be typed")
+            else:
+                self.paster = paster
+        
+        # Reader threads queue expansion jobs, the injector thread drains them
+        self.expansion_queue = queue.Queue(maxsize=self.config["expansion_queue_size"])
+        self.settle_delay = self.config["settle_delay_ms"] / 1000.0
+        self.dropped_expansions = 0
+        # Jobs taken off the queue behind another one; each still gets its own write
+        self.batched_expansions = 0
+        
+        # Per-stage latency histograms, from the trigger key to the typed text
+        self.latency = LatencyStats()
+        self.startup.mark("injector warm-up")
         
         # Initialize keyboard devices
         if EVDEV_AVAILABLE:
             self.initialize_keyboard_devices()
+        self.startup.mark("device open")
     
     def load_config(self):
         """Load configuration from file or create default"""
@@ -87,7 +188,24 @@ class EIMDaemonEnhanced:
             "key_timeout": 2.0,
             "buffer_size": 20,
             "clipboard_fallback": True,
-            "log_level": "INFO"
+            "log_level": "INFO",
+            "settle_delay_ms": 0,
+            "expansion_queue_size": 32,
+            "hot_reload": True,
+            "latency_export_path": "",
+            "control_socket": "",
+            "status_interval": 0,
+            "expansion_log_path": "",
+            "expansion_log_max_mb": 10,
+            "expansion_log_backups": 5,
+            "keyboard_layout": DEFAULT_LAYOUT,
+            "injection_backend": "dotool",
+            "uinput_key_delay_ms": 0,
+            "clipboard_watcher": "auto",
+            "paste_threshold": 32,
+            "paste_shortcut": "ctrl+v",
+            "paste_restore_delay_ms": 300,
+            "ignored_device_names": ["dotool*"]
         }
         
         try:
@@ -121,15 +239,10 @@ class EIMDaemonEnhanced:
             return
         
         try:
-            # Get all input devices
-            devices = [evdev.InputDevice(path) for path in evdev.list_devices()]
-            
-            # Filter for keyboard devices
-            keyboard_devices = []
-            for device in devices:
-                if evdev.ecodes.EV_KEY in device.capabilities():
-                    keyboard_devices.append(device)
-                    print(f"Found keyboard device: {device.name} ({device.path})")
+            # Classify every input device from sysfs; only the keyboards used are opened
+            keyboard_infos = [info for info in list_input_devices() if self.is_keyboard(info)]
+            for info in keyboard_infos:
+                print(f"Found keyboard device: {info.name} ({info.path})")
             
             # Use configured devices or auto-detect
             if self.config["keyboard_devices"]:
@@ -137,20 +250,32 @@ class EIMDaemonEnhanced:
                 for device_path in self.config["keyboard_devices"]:
                     try:
                         device = evdev.InputDevice(device_path)
-                        if evdev.ecodes.EV_KEY in device.capabilities():
+                        if self.ignored_device(device.name):
+                            print(f"Ignoring configured device {device_path}: {device.name} is a virtual keyboard that types expansions")
+                            device.close()
+                        elif evdev.ecodes.EV_KEY in device.capabilities():
                             self.keyboard_devices.append(device)
                             print(f"Using configured keyboard: {device.name}")
+                        else:
+                            device.close()
                     except Exception as e:
                         print(f"Warning: Could not open configured device {device_path}: {e}")
             elif self.config["auto_detect_keyboards"]:
                 # Auto-detect and use all keyboard devices
-                self.keyboard_devices = keyboard_devices
-                # Save detected devices to config
-                self.config["keyboard_devices"] = [d.path for d in keyboard_devices]
-                self.save_config(self.config)
+                for info in keyboard_infos:
+                    try:
+                        self.keyboard_devices.append(evdev.InputDevice(info.path))
+                    except Exception as e:
+                        print(f"Warning: Could not open keyboard {info.path}: {e}")
+                # Save detected devices to config (nothing to save when none were found)
+                if self.keyboard_devices:
+                    self.config["keyboard_devices"] = [d.path for d in self.keyboard_devices]
+                    self.save_config(self.config)
             
             if self.keyboard_devices:
                 print(f"Monitoring {len(self.keyboard_devices)} keyboard device(s)")
+                # Shift held or CapsLock on before the daemon started
+                self.modifiers.sync(self.keyboard_devices)
             else:
                 print("No keyboard devices found for monitoring")
                 
@@ -161,52 +286,62 @@ class EIMDaemonEnhanced:
     def signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully"""
         print(f"\nReceived signal {signum}, shutting down gracefully...")
+        self.stop()
+    
+    def stop(self):
+        """Wake every waiting thread for shutdown (safe to call from a signal handler)"""
+        # The keyboard event loop notices the flag and closes its devices
         self.running = False
-        
-        # Close keyboard devices
-        for device in self.keyboard_devices:
+        self.shutdown_event.set()
+        try:
+            os.write(self.wakeup_pipe[1], b"\0")
+        except OSError:
+            # Already written: the pipe stays readable until the process exits
+            pass
+    
+    def create_backend(self):
+        """Create the configured injection backend, falling back to dotool"""
+        if self.config["injection_backend"] == "uinput":
             try:
-                device.close()
-            except:
-                pass
+                # dotool, if installed, types what the keymap cannot
+                fallback = DotoolSession() if self.check_dotool() else None
+                backend = UinputSession(self.keymap, fallback,
+                                        key_delay=self.config["uinput_key_delay_ms"] / 1000.0)
+                backend.start()
+                print("✓ Typing through a uinput virtual keyboard")
+                return backend
+            except Exception as e:
+                print(f"Warning: uinput backend not available ({e}); using dotool")
+        elif self.config["injection_backend"] != "dotool":
+            print(f"Warning: Unknown injection backend '{self.config['injection_backend']}'; using dotool")
+        
+        # Check dotool availability
+        if not self.check_dotool():
+            print("Error: dotool not available. Please install it first.")
+            sys.exit(1)
+        # Long-lived dotool process shared by every injection, started now so
+        # the first expansion does not wait for it
+        backend = DotoolSession()
+        try:
+            backend.start()
+        except OSError as e:
+            print(f"Warning: Could not start dotool yet: {e}")
+        return backend
     
     def check_dotool(self):
-        """Check if dotool is available"""
-        try:
-            result = subprocess.run(['which', 'dotool'], 
-                                  capture_output=True, text=True)
-            return result.returncode == 0
-        except Exception:
-            return False
+        """Check if dotool is available (a PATH lookup, no process is spawned)"""
+        return shutil.which('dotool') is not None
     
     def get_clipboard_content(self):
-        """Get current clipboard content using xclip or wl-clipboard"""
-        try:
-            # Try wl-clipboard first (Wayland)
-            result = subprocess.run(['wl-clipboard', 'read'], 
-                                  capture_output=True, text=True, timeout=1)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-        
-        try:
-            # Try xclip as fallback
-            result = subprocess.run(['xclip', '-o', '-selection', 'clipboard'], 
-                                  capture_output=True, text=True, timeout=1)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-        
-        return ""
+        """Get current clipboard content using wl-paste or xclip"""
+        if self.clipboard_watcher is not None:
+            return self.clipboard_watcher.read()
+        return ClipboardWatcher(None).read()
     
     def simulate_keyboard_input(self, text):
-        """Simulate keyboard input using dotool"""
+        """Simulate keyboard input through the injection backend"""
         try:
-            result = subprocess.run(['dotool', 'type', text], 
-                                  capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
+            return self.backend.send(self.backend.build_commands(0, text))
         except Exception as e:
             print(f"Error typing text: {e}")
             return False
@@ -214,178 +349,473 @@ class EIMDaemonEnhanced:
     def delete_previous_text(self, abbreviation_length):
         """Delete the previously typed abbreviation"""
         try:
-            for _ in range(abbreviation_length):
-                subprocess.run(['dotool', 'key', 'BackSpace'], 
-                             capture_output=True, timeout=5)
-            return True
+            return self.backend.send(self.backend.build_commands(abbreviation_length))
         except Exception as e:
             print(f"Error deleting previous text: {e}")
             return False
     
+    def queue_expansion(self, abbreviation, expansion, method="keyboard", trigger_time=None, trigger=""):
+        """Queue an expansion job for the injector thread without blocking"""
+        # trigger_time is the trigger key's kernel timestamp (wall clock seconds);
+        # trigger is the character that key already typed after the abbreviation
+        if trigger_time is None:
+            trigger_time = time.time()
+        try:
+            self.expansion_queue.put_nowait(
+                (abbreviation, expansion, method, time.perf_counter(), trigger_time, trigger))
+            return True
+        except queue.Full:
+            # Backpressure: drop the job rather than stall the keyboard path
+            self.dropped_expansions += 1
+            print(f"✗ Expansion queue full, dropped: {abbreviation}")
+            return False
+    
+    def run_injector(self):
+        """Drain the expansion queue in order and inject each batch"""
+        while self.running:
+            # Blocks until a job arrives; shutdown queues None to wake it
+            job = self.expansion_queue.get()
+            if job is None:
+                break
+            
+            # Give the focused application a moment before typing
+            if self.settle_delay > 0:
+                time.sleep(self.settle_delay)
+            
+            # Take jobs that arrived back-to-back as one batch (written one by one)
+            jobs = [job]
+            while True:
+                try:
+                    job = self.expansion_queue.get_nowait()
+                except queue.Empty:
+                    break
+                # The shutdown sentinel: the loop condition ends the thread after this batch
+                if job is not None:
+                    jobs.append(job)
+            self.batched_expansions += len(jobs) - 1
+            
+            dequeued_at = time.perf_counter()
+            for job in jobs:
+                self.latency.record("queue_wait", (dequeued_at - job[3]) * 1000)
+            
+            self.inject_jobs(jobs)
+    
+    def paste_shortcut_valid(self):
+        """Whether the backend can press the configured paste shortcut"""
+        try:
+            self.backend.build_paste(self.config["paste_shortcut"])
+            return True
+        except (KeyError, ValueError, AttributeError):
+            return False
+    
+    def inject_jobs(self, jobs):
+        """Replace each abbreviation with its expansion, one backend write per job"""
+        start = time.perf_counter()
+        injected = 0
+        for abbreviation, expansion, method, queued_at, trigger_time, trigger in jobs:
+            # The keyboard is not grabbed, so the trigger Space or Enter has already
+            # reached the application: erase it too, and type it again afterwards
+            delete_count = len(abbreviation) + len(trigger)
+            try:
+                step = time.perf_counter()
+                if (self.paster is not None and len(expansion) >= self.config["paste_threshold"]
+                        and self.paster.prepare(expansion)):
+                    # BackSpaces and one paste shortcut, whatever the length, in a single write;
+                    # the user's clipboard comes back later, even if the write fails
+                    try:
+                        success = self.backend.send(
+                            self.backend.build_commands(delete_count)
+                            + self.backend.build_paste(self.config["paste_shortcut"])
+                            + self.backend.build_commands(0, trigger))
+                    finally:
+                        self.paster.schedule_restore()
+                else:
+                    # BackSpaces and text in one write, so no real keystroke can land in between
+                    success = self.backend.replace(delete_count, expansion + trigger)
+                written = time.perf_counter()
+            except Exception as e:
+                print(f"Error injecting expansion: {e}")
+                success = False
+            
+            if not success:
+                # The other jobs of the batch are independent: keep going, but count this one
+                self.dropped_expansions += 1
+                print(f"✗ Failed to inject expansion, dropped: {abbreviation}")
+                continue
+            
+            injected += 1
+            total_ms = (time.time() - trigger_time) * 1000
+            self.latency.record("inject", (written - step) * 1000)
+            self.latency.record("total", total_ms)
+            self.log_expansion(abbreviation, expansion, method, total_ms)
+        
+        print(f"Injected {injected} of {len(jobs)} expansion(s) in {(time.perf_counter() - start) * 1000:.2f} ms")
+        return injected == len(jobs)
+    
+    def category_index(self):
+        """Namespace index of the current dictionary, built on first use"""
+        categories = self.categories
+        if categories is None:
+            categories = self.categories = CategoryIndex(self.expansions)
+        return categories
+    
     def expand_abbreviation(self, abbreviation):
         """Expand an abbreviation to its full text"""
-        if abbreviation in EXPANSIONS_DATA:
-            return EXPANSIONS_DATA[abbreviation]
-        return None
-    
-    def log_expansion(self, abbreviation, expansion, method="keyboard"):
-        """Log expansion to history"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {abbreviation} → {expansion} ({method})"
-        self.expansion_history.append(log_entry)
+        return self.expansions.get(abbreviation)
+    
+    def reload_expansions(self):
+        """Rebuild the expansions and matcher from disk without disturbing lookups"""
+        start = time.perf_counter()
+        try:
+            expansions, options = load_expansions(reload=True)
+            matcher = HotstringMatcher(expansions, options)
+            categories = CategoryIndex(expansions)
+        except Exception as e:
+            # A broken data file keeps the current dictionary serving
+            self.reload_failures += 1
+            print(f"✗ Could not reload expansions, keeping the current dictionary: {e}")
+            return False
         
-        # Keep history manageable
-        if len(self.expansion_history) > self.max_history:
-            self.expansion_history.pop(0)
+        # Both swaps are single reference assignments: readers see either
+        # the old or the new dictionary, never a partly built one
+        self.expansions = expansions
+        self.categories = categories
+        self.pending_matcher = matcher
+        self.reloads += 1
+        self.last_reload_ms = (time.perf_counter() - start) * 1000
+        print(f"✓ Reloaded {matcher.pattern_count} hotstrings in {self.last_reload_ms:.1f} ms")
+        return True
+    
+    def watch_dictionary(self):
+        """Reload the expansions whenever the data file or compiled index changes"""
+        paths = {Path(path).resolve() for path in dictionary_paths()}
+        try:
+            inotify = Inotify()
+            # Watch the directories: editors and the compiler replace files by renaming
+            for directory in {path.parent for path in paths}:
+                inotify.add_watch(directory, IN_CLOSE_WRITE | IN_MOVED_TO | IN_ONLYDIR)
+        except OSError as e:
+            print(f"Warning: Hot reload not available: {e}")
+            return
         
-        print(log_entry)
+        print(f"Watching {len(paths)} dictionary file(s) for changes")
+        selector = selectors.DefaultSelector()
+        selector.register(inotify.fileno(), selectors.EVENT_READ, inotify)
+        selector.register(self.wakeup_pipe[0], selectors.EVENT_READ)
+        changed_at = None
+        try:
+            while self.running:
+                # Sleep until a change (or shutdown), then wait for a short quiet
+                # period so a burst of writes triggers one reload
+                ready = selector.select(timeout=None if changed_at is None else 0.2)
+                if ready:
+                    if any(key.data is inotify for key, _ in ready):
+                        for wd, mask, name in inotify.read():
+                            if Path(inotify.watches.get(wd, ""), name).resolve() in paths:
+                                changed_at = time.time()
+                elif changed_at is not None:
+                    changed_at = None
+                    self.reload_expansions()
+        finally:
+            selector.close()
+            inotify.close()
     
-    def process_key_event(self, event):
-        """Process individual key events for abbreviation detection"""
+    def log_expansion(self, abbreviation, expansion, method="keyboard", latency_ms=None):
+        """Log expansion to history (and the on-disk log, if enabled)"""
+        record = self.expansion_history.append(time.time(), abbreviation, expansion, method, latency_ms)
+        if self.expansion_log is not None:
+            self.expansion_log.append(record)
+        
+        print(ExpansionHistory.format(record))
+    
+    def typing_states(self):
+        """The TypingState of every keyboard, plus the default one"""
+        return [self.typing] + [reader.state for reader in list(self.device_readers.values())]
+    
+    def swap_pending_matcher(self):
+        """Switch to a reloaded matcher, carrying over the words being typed"""
+        matcher = self.pending_matcher
+        self.pending_matcher = None
+        # The cursors index the old matcher's tables: replay each word on the new one
+        for typing in self.typing_states():
+            word = typing.current_word()
+            typing.reset()
+            for char in word:
+                matcher.feed(typing, char)
+        self.matcher = matcher
+    
+    def process_key_event(self, event, typing=None):
+        """Process individual key events for abbreviation detection
+        
+        typing is the TypingState of the keyboard the event came from; the
+        modifier state is shared, as the keyboards of one seat share it.
+        """
+        if typing is None:
+            typing = self.typing
+        # Only this thread touches matcher state, so the swap needs no lock
+        if self.pending_matcher is not None:
+            self.swap_pending_matcher()
+        
         if event.type == evdev.ecodes.EV_KEY:
+            code = event.code
+            # Shift, CapsLock and Ctrl/Alt/Meta only change the table index; they are
+            # tracked while paused too, so letters decode correctly after resume
+            if self.modifiers.update(code, event.value):
+                return
+            
+            if self.paused:
+                typing.reset()
+                return
+            
             if event.value == evdev.KeyEvent.key_down:
-                # Get the key name
-                key_name = evdev.ecodes.KEY[event.code]
-                
                 # Handle special keys
-                if key_name == 'KEY_SPACE':
+                if code == evdev.ecodes.KEY_SPACE:
                     # Space key - check if we have an abbreviation
-                    self.check_abbreviation()
-                    self.current_abbreviation = ""
-                    self.abbreviation_buffer.clear()
-                elif key_name == 'KEY_ENTER':
+                    self.check_abbreviation(event, typing)
+                    typing.reset()
+                elif code == evdev.ecodes.KEY_ENTER:
                     # Enter key - check abbreviation and clear
-                    self.check_abbreviation()
-                    self.current_abbreviation = ""
-                    self.abbreviation_buffer.clear()
-                elif key_name == 'KEY_BACKSPACE':
-                    # Backspace - remove last character
-                    if self.current_abbreviation:
-                        self.current_abbreviation = self.current_abbreviation[:-1]
-                elif key_name.startswith('KEY_'):
-                    # Regular key - add to abbreviation
-                    if len(key_name) == 4:  # Single character key
-                        char = key_name[3].lower()
-                        self.current_abbreviation += char
-                        self.abbreviation_buffer.append(char)
-                        self.last_key_time = time.time()
+                    self.check_abbreviation(event, typing)
+                    typing.reset()
+                elif code == evdev.ecodes.KEY_BACKSPACE:
+                    # Backspace - step the matcher back one character
+                    typing.backspace()
+                else:
+                    # Regular key - add the character it types, if any, to the abbreviation
+                    char = self.keymap.chars[code * STATES | self.modifiers.state]
+                    if char is not None:
+                        self.matcher.feed(typing, char)
+                        typing.last_key_time = time.time()
                 
                 # Check for timeout
-                if time.time() - self.last_key_time > self.config["key_timeout"]:
-                    self.current_abbreviation = ""
-                    self.abbreviation_buffer.clear()
+                if time.time() - typing.last_key_time > self.config["key_timeout"]:
+                    typing.reset()
     
-    def check_abbreviation(self):
+    def check_abbreviation(self, event=None, typing=None):
         """Check if current abbreviation should be expanded"""
-        if not self.current_abbreviation:
-            return
+        if typing is None:
+            typing = self.typing
+        trigger_time = None
+        if event is not None:
+            # Kernel timestamps use the wall clock, like time.time()
+            trigger_time = event.sec + event.usec / 1000000
+            self.latency.record("event_read", (time.time() - trigger_time) * 1000)
         
-        # Check if it's a valid abbreviation
-        expansion = self.expand_abbreviation(self.current_abbreviation)
-        if expansion:
-            print(f"\nDetected abbreviation: {self.current_abbreviation}")
+        # Whole-word or in-word hotstring ending at the current keystroke
+        start = time.perf_counter()
+        match = self.matcher.match(typing)
+        self.latency.record("match", (time.perf_counter() - start) * 1000)
+        if match:
+            abbreviation, expansion = match
+            print(f"\nDetected abbreviation: {abbreviation}")
             print(f"Expanding to: {expansion}")
             
-            # Wait a moment for user to focus on text field
-            print("Please click in a text field within 3 seconds...")
-            time.sleep(3)
-            
-            # Delete the abbreviation and type expansion
-            if self.delete_previous_text(len(self.current_abbreviation)):
-                if self.simulate_keyboard_input(expansion):
-                    self.log_expansion(self.current_abbreviation, expansion, "keyboard")
-                    print("✓ Expansion completed successfully!")
-                else:
-                    print("✗ Failed to type expansion")
-            else:
-                print("✗ Failed to delete abbreviation")
+            # The Space or Enter that fired the match is retyped after the expansion
+            trigger = ""
+            if event is not None:
+                trigger = "\n" if event.code == evdev.ecodes.KEY_ENTER else " "
+            # Hand off to the injector thread; never block the reader on dotool
+            self.queue_expansion(abbreviation, expansion, "keyboard", trigger_time, trigger)
     
     def monitor_keyboard_devices(self):
-        """Monitor keyboard devices for input"""
-        if not self.keyboard_devices:
-            print("No keyboard devices available for monitoring")
-            return
-        
+        """Monitor all keyboard devices from a single event loop"""
         print("Starting keyboard device monitoring...")
         print(f"Monitoring {len(self.keyboard_devices)} device(s)")
         
-        # Create a thread for each keyboard device
-        keyboard_threads = []
-        for device in self.keyboard_devices:
-            thread = threading.Thread(
-                target=self._monitor_single_device,
-                args=(device,),
-                daemon=True
-            )
-            thread.start()
-            keyboard_threads.append(thread)
+        # Only the keys the keymap decodes, plus the ones handled specially
+        self.monitored_key_codes = self.keymap.key_codes() | set(MODIFIER_KEYS) | {
+            evdev.ecodes.KEY_SPACE, evdev.ecodes.KEY_ENTER, evdev.ecodes.KEY_BACKSPACE}
+        
+        # Multiplex every device fd in one selector (epoll on Linux)
+        selector = selectors.DefaultSelector()
+        for device in list(self.keyboard_devices):
+            self.attach_device(selector, device)
         
-        # Wait for threads to complete
-        for thread in keyboard_threads:
-            thread.join()
+        # Keyboards plugged in or removed later: watch /dev/input for event nodes
+        hotplug = None
+        try:
+            hotplug = Inotify()
+            hotplug.add_watch(INPUT_DIR, IN_CREATE | IN_ATTRIB | IN_DELETE)
+            selector.register(hotplug.fileno(), selectors.EVENT_READ, hotplug)
+        except OSError as e:
+            print(f"Warning: Keyboard hotplug not available: {e}")
+            if hotplug is not None:
+                hotplug.close()
+            hotplug = None
+        if not self.keyboard_devices and hotplug is not None:
+            print("Waiting for a keyboard to be connected...")
+        # Shutdown makes this readable, so select() needs no timeout
+        selector.register(self.wakeup_pipe[0], selectors.EVENT_READ)
+        
+        try:
+            # The wakeup pipe alone leaves nothing to monitor
+            while self.running and len(selector.get_map()) > 1:
+                ready = selector.select()
+                
+                events = []
+                for key, _ in ready:
+                    reader = key.data
+                    if reader is None:
+                        # The wakeup pipe: the loop condition sees the shutdown
+                        continue
+                    if reader is hotplug:
+                        self.handle_hotplug(selector, hotplug.read())
+                        continue
+                    try:
+                        # Key events of whole SYN_REPORT frames, one read() per device
+                        typing = reader.state
+                        events.extend([(event, typing) for event in reader.read()])
+                    except BlockingIOError:
+                        continue
+                    except Exception as e:
+                        print(f"Error monitoring device {reader.device.name}: {e}")
+                        self.detach_device(selector, reader)
+                        continue
+                    
+                    if reader.dropped:
+                        # Events were lost: this keyboard's word and the modifier state are unknown
+                        reader.dropped = False
+                        reader.state.reset()
+                        self.modifiers.sync(self.keyboard_devices)
+                
+                # Each keyboard matches its own word; the shared modifiers still
+                # need every device's events in kernel timestamp order
+                if len(events) > 1:
+                    events.sort(key=lambda item: (item[0].sec, item[0].usec))
+                for event, typing in events:
+                    self.process_key_event(event, typing)
+        finally:
+            selector.close()
+            if hotplug is not None:
+                hotplug.close()
+            for device in self.keyboard_devices:
+                self._close_device(device)
+    
+    def is_keyboard(self, info):
+        """True for devices sysfs classifies as keyboards, except the ones that type expansions"""
+        return info is not None and "keyboards" in info.categories and not self.ignored_device(info.name)
+    
+    def ignored_device(self, name):
+        """True for the injection backends' virtual keyboards (reading them would re-read our own typing)"""
+        return name == UINPUT_DEVICE_NAME or any(
+            fnmatch.fnmatchcase(name, pattern) for pattern in self.config["ignored_device_names"])
     
-    def _monitor_single_device(self, device):
-        """Monitor a single keyboard device"""
+    def wanted_device(self, path):
+        """Whether a newly connected device node should be monitored"""
+        if self.config["auto_detect_keyboards"]:
+            return True
+        configured = {os.path.realpath(device_path) for device_path in self.config["keyboard_devices"]}
+        return os.path.realpath(path) in configured
+    
+    def attach_device(self, selector, device):
+        """Start reading a keyboard in the event loop"""
         try:
-            print(f"Monitoring device: {device.name}")
-            for event in device.read_loop():
-                if not self.running:
-                    break
-                self.process_key_event(event)
+            # The word typed on this keyboard, matched independently of the others
+            reader = DeviceReader(device, self.monitored_key_codes, evdev.InputEvent, TypingState())
+            selector.register(device.fd, selectors.EVENT_READ, reader)
         except Exception as e:
             print(f"Error monitoring device {device.name}: {e}")
-        finally:
-            try:
-                device.close()
-            except:
-                pass
+            self._close_device(device)
+            return False
+        self.device_readers[device.path] = reader
+        if device not in self.keyboard_devices:
+            # Replace rather than mutate: the control socket reads the list from another thread
+            self.keyboard_devices = self.keyboard_devices + [device]
+        print(f"Monitoring device: {device.name}")
+        return True
+    
+    def detach_device(self, selector, reader):
+        """Stop reading a keyboard and drop its reader (with its partial frame and word)"""
+        device = reader.device
+        try:
+            selector.unregister(reader.fd)
+        except (KeyError, ValueError):
+            pass
+        self._close_device(device)
+        self.device_readers.pop(device.path, None)
+        self.keyboard_devices = [other for other in self.keyboard_devices if other is not device]
+        # Modifiers held on the removed keyboard are released
+        self.modifiers.sync(self.keyboard_devices)
+    
+    def handle_hotplug(self, selector, changes):
+        """Attach or detach the device nodes named in inotify events"""
+        for wd, mask, name in changes:
+            if not name.startswith("event"):
+                continue
+            path = os.path.join(INPUT_DIR, name)
+            if mask & IN_DELETE:
+                reader = self.device_readers.get(path)
+                if reader is not None:
+                    print(f"Keyboard disconnected: {reader.device.name}")
+                    self.detach_device(selector, reader)
+            elif path not in self.device_readers and self.wanted_device(path):
+                # Decided from sysfs, so mice and other devices are never opened
+                if not self.is_keyboard(describe_device(path)):
+                    continue
+                # IN_ATTRIB follows once udev has set the permissions, so a failed open is retried then
+                try:
+                    device = evdev.InputDevice(path)
+                except OSError:
+                    continue
+                print(f"Keyboard connected: {device.name} ({path})")
+                self.attach_device(selector, device)
+    
+    def _close_device(self, device):
+        """Close a keyboard device, ignoring errors"""
+        try:
+            device.close()
+        except Exception:
+            pass
     
     def monitor_clipboard(self):
-        """Monitor clipboard for abbreviations (fallback method)"""
+        """Watch the clipboard for abbreviations (fallback method)"""
         if not self.config["clipboard_fallback"]:
             return
         
         print("Starting clipboard monitoring (fallback)...")
         print("Type abbreviations anywhere and copy them to auto-expand!")
         
-        while self.running:
-            try:
-                current_clipboard = self.get_clipboard_content()
+        # Changes arrive as events (wl-paste --watch or X11); polling backs off when idle
+        performance = self.config.get("performance", {})
+        self.clipboard_watcher = ClipboardWatcher(
+            self.handle_clipboard_change,
+            mode=self.config["clipboard_watcher"],
+            min_interval=performance.get("clipboard_check_interval", 0.5),
+            max_interval=performance.get("clipboard_max_interval", 8.0))
+        self.clipboard_watcher.start()
+    
+    def handle_clipboard_change(self, current_clipboard):
+        """Expand a copied abbreviation (called on the clipboard watcher thread)"""
+        if self.paster is not None and self.paster.own_change():
+            # An expansion being pasted, or the user's text being put back
+            self.last_clipboard = current_clipboard
+            return
+        try:
+            # Check if clipboard content changed and contains an abbreviation
+            if (current_clipboard != self.last_clipboard and 
+                current_clipboard and not self.paused and 
+                current_clipboard in self.expansions):
                 
-                # Check if clipboard content changed and contains an abbreviation
-                if (current_clipboard != self.last_clipboard and 
-                    current_clipboard and 
-                    current_clipboard in EXPANSIONS_DATA):
+                abbreviation = current_clipboard
+                expansion = self.expand_abbreviation(abbreviation)
+                
+                if expansion:
+                    print(f"\nDetected abbreviation: {abbreviation}")
+                    print(f"Expanding to: {expansion}")
                     
-                    abbreviation = current_clipboard
-                    expansion = self.expand_abbreviation(abbreviation)
+                    # Wait a moment for user to focus on text field; a timer does the
+                    # waiting so the watcher thread keeps reporting clipboard changes
+                    print("Please click in a text field within 3 seconds...")
                     
-                    if expansion:
-                        print(f"\nDetected abbreviation: {abbreviation}")
-                        print(f"Expanding to: {expansion}")
-                        
-                        # Wait a moment for user to focus on text field
-                        print("Please click in a text field within 3 seconds...")
-                        time.sleep(3)
-                        
-                        # Delete the abbreviation and type expansion
-                        if self.delete_previous_text(len(abbreviation)):
-                            if self.simulate_keyboard_input(expansion):
-                                self.log_expansion(abbreviation, expansion, "clipboard")
-                                print("✓ Expansion completed successfully!")
-                            else:
-                                print("✗ Failed to type expansion")
-                        else:
-                            print("✗ Failed to delete abbreviation")
-                
-                self.last_clipboard = current_clipboard
-                time.sleep(0.5)  # Check every 500ms
-                
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                print(f"Error in clipboard monitoring: {e}")
-                time.sleep(1)
+                    # Delete the abbreviation and type expansion
+                    timer = threading.Timer(3, self.queue_expansion, (abbreviation, expansion, "clipboard"))
+                    timer.daemon = True
+                    timer.start()
+            
+            self.last_clipboard = current_clipboard
+            
+        except Exception as e:
+            print(f"Error in clipboard monitoring: {e}")
     
     def show_status(self):
         """Show current status and recent expansions"""
@@ -393,58 +823,186 @@ class EIMDaemonEnhanced:
         print("EIM Text Expansion Daemon Status (Enhanced)")
         print("="*50)
         print(f"Running: {self.running}")
-        print(f"Total expansions: {len(EXPANSIONS_DATA)}")
+        print(f"Total expansions: {len(self.expansions)}")
         print(f"Recent expansions: {len(self.expansion_history)}")
         print(f"Keyboard devices: {len(self.keyboard_devices)}")
-        print(f"Current abbreviation: '{self.current_abbreviation}'")
+        words = [typing.current_word() for typing in self.typing_states()]
+        print(f"Current abbreviations: {', '.join(repr(word) for word in words if word) or 'none'}")
+        print(f"Injection backend: {self.backend.name} "
+              f"{'running' if self.backend.is_alive() else 'stopped'} "
+              f"({self.backend.injections} injections, {self.backend.restarts} restarts, "
+              f"avg {self.backend.average_injection_ms():.3f} ms)")
+        print(f"Expansion queue: {self.expansion_queue.qsize()} pending, "
+              f"{self.batched_expansions} batched, {self.dropped_expansions} dropped")
+        print(f"Dictionary reloads: {self.reloads} ({self.reload_failures} failed, "
+              f"last took {self.last_reload_ms:.1f} ms)")
+        if self.clipboard_watcher is not None:
+            clipboard = self.clipboard_watcher.stats()
+            print(f"Clipboard watcher: {clipboard['mode']} ({clipboard['changes']} changes, "
+                  f"{clipboard['spawns']} spawns, {clipboard['wakeups']} wakeups, "
+                  f"{clipboard['cpu_ms']:.1f} ms CPU)")
+        
+        latency_lines = self.latency.summary_lines()
+        if latency_lines:
+            print("\nExpansion latency:")
+            for line in latency_lines:
+                print(f"  {line}")
+        self.export_latency()
         
         if self.expansion_history:
             print("\nRecent expansions:")
-            for entry in self.expansion_history[-10:]:  # Show last 10
-                print(f"  {entry}")
+            for record in self.expansion_history.recent(10):  # Show last 10
+                print(f"  {ExpansionHistory.format(record)}")
         
         print("\nAvailable abbreviation categories:")
-        categories = {}
-        for abbr in EXPANSIONS_DATA.keys():
-            if abbr.startswith('a') or abbr.startswith('A'):
-                categories['Text Abbreviations'] = categories.get('Text Abbreviations', 0) + 1
-            elif abbr.startswith('la') or abbr.startswith('LA'):
-                categories['Legal Phrases'] = categories.get('Legal Phrases', 0) + 1
-            elif abbr.startswith('n') or abbr.startswith('t'):
-                categories['Word Completions'] = categories.get('Word Completions', 0) + 1
-            elif abbr.startswith('US') or abbr.startswith('CA') or abbr.startswith('cc'):
-                categories['Geographic'] = categories.get('Geographic', 0) + 1
-            elif abbr.startswith('1w'):
-                categories['Single Words'] = categories.get('Single Words', 0) + 1
-            else:
-                categories['Other'] = categories.get('Other', 0) + 1
-        
-        for category, count in categories.items():
+        for category, count in self.category_index().counts().items():
             print(f"  {category}: {count}")
     
+    def counters(self):
+        """Counters for the control socket"""
+        return {
+            "injections": self.backend.injections,
+            "injection_failures": self.backend.failures,
+            "backend_restarts": self.backend.restarts,
+            "average_injection_ms": round(self.backend.average_injection_ms(), 3),
+            "queued": self.expansion_queue.qsize(),
+            "batched": self.batched_expansions,
+            "dropped": self.dropped_expansions,
+            "reloads": self.reloads,
+            "reload_failures": self.reload_failures,
+            "last_reload_ms": round(self.last_reload_ms, 3),
+            "pastes": self.paster.pastes if self.paster is not None else 0,
+            "clipboard": self.clipboard_watcher.stats() if self.clipboard_watcher is not None else None,
+        }
+    
+    def status_snapshot(self):
+        """Daemon state for the control socket"""
+        latency = {}
+        for stage, histogram in self.latency.histograms.items():
+            if histogram.count:
+                latency[stage] = {
+                    "p50_ms": histogram.percentile(0.50),
+                    "p95_ms": histogram.percentile(0.95),
+                    "p99_ms": histogram.percentile(0.99),
+                    "count": histogram.count,
+                }
+        return {
+            "running": self.running,
+            "paused": self.paused,
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "expansions": len(self.expansions),
+            "hotstrings": self.matcher.pattern_count,
+            "namespaces": self.category_index().counts(),
+            "keyboard_devices": len(self.keyboard_devices),
+            "keyboard_layout": self.keymap.layout,
+            "backend": self.backend.name,
+            "backend_state": "running" if self.backend.is_alive() else "stopped",
+            "counters": self.counters(),
+            "latency": latency,
+            "startup_ms": self.startup.to_dict(),
+        }
+    
+    def namespace_entries(self, request):
+        """Abbreviations and expansions in one namespace or source section"""
+        name = request.get("namespace", "")
+        categories, expansions = self.category_index(), self.expansions
+        abbreviations = categories.entries(name)
+        if abbreviations is None:
+            raise ValueError(f"Unknown namespace: {name} (known: {', '.join(categories.counts())})")
+        return {abbreviation: expansions.get(abbreviation) for abbreviation in abbreviations}
+    
+    def set_paused(self, paused):
+        """Pause or resume expanding (keys are still read, but ignored)"""
+        self.paused = paused
+        print("⏸ Expansion paused" if paused else "▶ Expansion resumed")
+        return {"paused": self.paused}
+    
+    def control_handlers(self):
+        """Commands served on the control socket"""
+        return {
+            "ping": lambda request: "pong",
+            "status": lambda request: self.status_snapshot(),
+            "counters": lambda request: self.counters(),
+            "history": lambda request: [
+                ExpansionHistory.format(record)
+                for record in self.expansion_history.recent(int(request.get("count", 10)))
+            ],
+            "latency": lambda request: self.latency.to_dict(),
+            "namespaces": lambda request: self.category_index().counts(),
+            "entries": self.namespace_entries,
+            "devices": lambda request: [
+                self.device_readers[device.path].stats() if device.path in self.device_readers
+                else {"name": device.name, "path": device.path}
+                for device in self.keyboard_devices
+            ],
+            "reload": lambda request: {
+                "reloaded": self.reload_expansions(),
+                "last_reload_ms": round(self.last_reload_ms, 3),
+            },
+            "pause": lambda request: self.set_paused(True),
+            "resume": lambda request: self.set_paused(False),
+        }
+    
+    def export_latency(self):
+        """Write the latency histograms to the configured JSON file, if any"""
+        path = self.config["latency_export_path"]
+        if not path:
+            return
+        try:
+            self.latency.export(os.path.expanduser(path))
+        except Exception as e:
+            print(f"Warning: Could not export latency histograms: {e}")
+    
     def run(self):
         """Main daemon loop"""
+        # Only needed once the daemon is up, so not imported at startup
+        from eim_control import ControlServer
+        control = ControlServer(self.control_handlers(), self.config["control_socket"] or None)
         try:
-            # Start keyboard monitoring if available
-            if EVDEV_AVAILABLE and self.keyboard_devices:
+            if self.expansion_log is not None:
+                try:
+                    self.expansion_log.start()
+                    print(f"✓ Logging expansions to {self.expansion_log.path}")
+                except Exception as e:
+                    print(f"Warning: Expansion log not available: {e}")
+                    self.expansion_log = None
+            
+            # Start the injector before any reader can queue expansions
+            injector_thread = threading.Thread(target=self.run_injector, daemon=True)
+            injector_thread.start()
+            
+            # Start keyboard monitoring if available, even before a keyboard is plugged in
+            if EVDEV_AVAILABLE:
                 keyboard_thread = threading.Thread(target=self.monitor_keyboard_devices, daemon=True)
                 keyboard_thread.start()
                 print("✓ Keyboard monitoring started")
             else:
                 print("⚠ Keyboard monitoring not available")
+            print(f"✓ Ready in {self.startup.total_ms():.1f} ms")
+            
+            # Reload the dictionary in the background when its files change
+            if self.config["hot_reload"]:
+                reload_thread = threading.Thread(target=self.watch_dictionary, daemon=True)
+                reload_thread.start()
             
             # Start clipboard monitoring as fallback
             if self.config["clipboard_fallback"]:
-                clipboard_thread = threading.Thread(target=self.monitor_clipboard, daemon=True)
-                clipboard_thread.start()
+                self.monitor_clipboard()
                 print("✓ Clipboard monitoring started")
             
-            # Main loop for status updates and user interaction
+            # Serve status and control requests on a local socket
+            try:
+                control.start()
+                print(f"✓ Control socket listening on {control.path}")
+            except Exception as e:
+                print(f"Warning: Control socket not available: {e}")
+            
+            # Sleep until shutdown; print status periodically only if configured
+            interval = self.config["status_interval"]
             while self.running:
                 try:
-                    # Show status every 30 seconds
-                    time.sleep(30)
-                    if self.running:
+                    self.shutdown_event.wait(interval if interval > 0 else None)
+                    if self.running and interval > 0:
                         self.show_status()
                         
                 except KeyboardInterrupt:
@@ -454,7 +1012,23 @@ class EIMDaemonEnhanced:
             print(f"Error in main daemon loop: {e}")
         finally:
             print("\nShutting down EIM enhanced daemon...")
+            # Not queued by signal_handler(): a signal can arrive while this
+            # thread holds the queue's lock
+            self.stop()
+            try:
+                self.expansion_queue.put_nowait(None)
+            except queue.Full:
+                # The injector has jobs to take and checks the flag after them
+                pass
+            control.close()
+            if self.clipboard_watcher is not None:
+                self.clipboard_watcher.close()
             self.show_status()
+            if self.paster is not None:
+                self.paster.close()
+            self.backend.close()
+            if self.expansion_log is not None:
+                self.expansion_log.close()
 
 def main():
     """Main function"""
@@ -469,6 +1043,15 @@ def main():
         sys.stderr = open('/dev/null', 'w')
     
     daemon = EIMDaemonEnhanced()
+    if '--profile-startup' in sys.argv[1:]:
+        # Report where the time to ready went, then exit without monitoring
+        print("\nStartup phases:")
+        for line in daemon.startup.summary_lines():
+            print(f"  {line}")
+        daemon.backend.close()
+        for device in daemon.keyboard_devices:
+            daemon._close_device(device)
+        return
     daemon.run()
 
 if __name__ == "__main__":
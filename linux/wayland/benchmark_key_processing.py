@@ -0,0 +1,546 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EIM Key Processing Benchmark
+Replays keyboard event streams through the daemon's matching logic
+
+Dotool injection is replaced by a counter, so only the per-keystroke work is
+measured: process_key_event, check_abbreviation and expand_abbreviation.
+
+Requirements:
+- Python 3.6+
+- evdev (Linux input device monitoring)
+
+Usage:
+python3 benchmark_key_processing.py                       # synthetic stream
+python3 benchmark_key_processing.py --json results.json   # save machine-readable results
+python3 benchmark_key_processing.py --compare results.json
+python3 benchmark_key_processing.py --record events.txt --device /dev/input/event3
+python3 benchmark_key_processing.py --events events.txt   # replay a recording
+python3 benchmark_key_processing.py --paste-cutoff        # time typing vs pasting (types into the focused window)
+
+Options:
+--keystrokes N        synthetic keystrokes to replay (default 20000)
+--rate N              keystrokes per second for the realistic run (default 8)
+--seconds N           length of the realistic run and of --record (default 5)
+--sizes A,B,C         dictionary sizes for the scaling curve (default 1000,10000,100000)
+--devices A,B,C       keyboard counts for the interleaved-typing run (default 1,2,8,32)
+--label TEXT          name stored with the results
+--lengths A,B,C       expansion lengths for --paste-cutoff (default 8,16,32,64,128)
+-h, --help            show this text
+"""
+
+import contextlib
+import gc
+import json
+import os
+import platform
+import random
+import string
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+try:
+    import evdev
+except ImportError:
+    print("Error: evdev not available")
+    print("Install with: pip3 install evdev")
+    sys.exit(1)
+
+# The daemon and the shared dictionary live next to / above this script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import EIM_autokey_dotool_daemon_evdev as daemon_module
+from eim_matcher import HotstringMatcher, TypingState
+from eim_keymap import KeyMap, KEY_LEFTSHIFT, MODIFIER_KEYS
+from eim_clipboard import ClipboardPaster
+
+BENCHMARK_VERSION = 2
+SYNTHETIC_SEED = 1234
+
+
+class ReplayDaemon(daemon_module.EIMDaemonEnhanced):
+    """Daemon whose devices, config file and injection are replaced for replay"""
+
+    def __init__(self):
+        self.injected = 0
+        # No config file: defaults only, and save_config() writes nothing
+        super().__init__(config_file="")
+
+    def check_dotool(self):
+        return True
+
+    def save_config(self, config):
+        pass
+
+    def initialize_keyboard_devices(self):
+        pass
+
+    def queue_expansion(self, abbreviation, expansion, method="keyboard", trigger_time=None, trigger=""):
+        self.injected += 1
+        return True
+
+    def use_dictionary(self, expansions, options=None):
+        """Swap in another dictionary for the scaling runs"""
+        self.expansions = expansions
+        self.matcher = HotstringMatcher(expansions, options)
+        self.typing.reset()
+
+
+def key_events(text, start=0.0, interval=0.0, keymap=None):
+    """Turn text into the key events the daemon receives (down, up)
+
+    Characters that need Shift on the layout are wrapped in Shift down/up.
+    SYN_REPORT events are left out: the device reader consumes them."""
+    keymap = keymap or KeyMap()
+    events = []
+    for index, char in enumerate(text):
+        shift = False
+        if char == " ":
+            code = evdev.ecodes.KEY_SPACE
+        elif char == "\n":
+            code = evdev.ecodes.KEY_ENTER
+        elif char == "\b":
+            code = evdev.ecodes.KEY_BACKSPACE
+        else:
+            code, shift = keymap.keystrokes[char]
+        timestamp = start + index * interval
+        sec, usec = int(timestamp), int((timestamp % 1) * 1000000)
+        presses = [(code, evdev.KeyEvent.key_down), (code, evdev.KeyEvent.key_up)]
+        if shift:
+            presses = ([(KEY_LEFTSHIFT, evdev.KeyEvent.key_down)] + presses
+                       + [(KEY_LEFTSHIFT, evdev.KeyEvent.key_up)])
+        for key, value in presses:
+            events.append(evdev.InputEvent(sec, usec, evdev.ecodes.EV_KEY, key, value))
+    return events
+
+
+def character_groups(events):
+    """Split events into one list per typed character
+
+    A character's group starts at its first key-down (Shift included) and
+    takes every release up to the next character's key-down."""
+    groups = []
+    pressed = True
+    for event in events:
+        if not groups or (pressed and event.value == evdev.KeyEvent.key_down):
+            groups.append([])
+            pressed = False
+        groups[-1].append(event)
+        if event.value == evdev.KeyEvent.key_down and event.code not in MODIFIER_KEYS:
+            pressed = True
+    return groups
+
+
+def synthetic_text(expansions, keystrokes, hit_rate=0.1, seed=SYNTHETIC_SEED):
+    """Prose-like text built from expansion words with abbreviations mixed in"""
+    rng = random.Random(seed)
+    typeable = set(string.ascii_letters + string.digits)
+    abbreviations = [abbr for abbr in expansions if set(abbr) <= typeable]
+    words = sorted({
+        word for expansion in expansions.values()
+        for word in expansion.lower().split() if set(word) <= typeable
+    }) or ["the", "quick", "brown", "fox"]
+
+    pieces = []
+    length = 0
+    while length < keystrokes:
+        roll = rng.random()
+        if roll < hit_rate and abbreviations:
+            word = rng.choice(abbreviations)
+        elif roll < hit_rate + 0.02:
+            # A typo fixed with BackSpace
+            word = rng.choice(words) + "x\b"
+        else:
+            word = rng.choice(words)
+        pieces.append(word)
+        length += len(word) + 1
+    return " ".join(pieces)[:keystrokes]
+
+
+def synthetic_dictionary(size, seed=SYNTHETIC_SEED):
+    """Random lower-case abbreviations for the dictionary-size scaling curve"""
+    rng = random.Random(seed)
+    expansions = {}
+    while len(expansions) < size:
+        abbreviation = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8)))
+        expansions[abbreviation] = " ".join(
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9)))
+            for _ in range(rng.randint(1, 5)))
+    return expansions
+
+
+def quiet():
+    """Silence the daemon's per-expansion prints while measuring"""
+    return contextlib.redirect_stdout(open(os.devnull, "w"))
+
+
+def run_flood(daemon, events, repeat=3):
+    """Replay events back to back; best of `repeat` runs"""
+    process = daemon.process_key_event
+    best = None
+    for _ in range(repeat):
+        daemon.typing.reset()
+        injected = daemon.injected
+        with quiet():
+            start = time.perf_counter_ns()
+            for event in events:
+                process(event)
+            elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return {
+        "events": len(events),
+        "ns_per_event": best / len(events),
+        "events_per_s": len(events) / (best / 1e9),
+        "expansions": daemon.injected - injected,
+    }
+
+
+def run_paced(daemon, events, rate, seconds):
+    """Replay at typing speed (the events of one character are sent together)"""
+    process = daemon.process_key_event
+    groups = character_groups(events)[:int(rate * seconds)]
+    latencies = []
+    daemon.typing.reset()
+    with quiet():
+        next_time = time.perf_counter()
+        for group in groups:
+            next_time += 1.0 / rate
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            start = time.perf_counter_ns()
+            for event in group:
+                process(event)
+            latencies.append((time.perf_counter_ns() - start) / len(group))
+    latencies.sort()
+    return {
+        "keystrokes_per_s": rate,
+        "events": sum(len(group) for group in groups),
+        "ns_per_event": sum(latencies) / len(latencies) if latencies else 0.0,
+        "p50_ns": latencies[len(latencies) // 2] if latencies else 0.0,
+        "p99_ns": latencies[int(len(latencies) * 0.99)] if latencies else 0.0,
+    }
+
+
+def run_allocations(daemon, events):
+    """Memory allocated while replaying, per event
+
+    CPython keeps no per-allocation counter outside debug builds, so this
+    reports what tracemalloc and sys.getallocatedblocks() can see: peak
+    traced bytes, and blocks still alive afterwards.
+    """
+    process = daemon.process_key_event
+    daemon.typing.reset()
+    gc.collect()
+    collections_before = sum(stat["collections"] for stat in gc.get_stats())
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    with quiet():
+        for event in events:
+            process(event)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    daemon.typing.reset()
+    gc.collect()
+    return {
+        "peak_bytes_per_event": peak / len(events),
+        "retained_blocks_per_event": (sys.getallocatedblocks() - blocks_before) / len(events),
+        "gc_collections": sum(stat["collections"] for stat in gc.get_stats()) - collections_before,
+    }
+
+
+def run_functions(daemon, count=100000):
+    """Per-call cost of check_abbreviation and expand_abbreviation"""
+    abbreviations = [abbr for abbr, _ in zip(daemon.expansions, range(1000))]
+    misses = [abbr + "zq" for abbr in abbreviations]
+    results = {}
+
+    for name, keys in (("expand_hit", abbreviations), ("expand_miss", misses)):
+        lookups = (keys * (count // len(keys) + 1))[:count]
+        expand = daemon.expand_abbreviation
+        start = time.perf_counter_ns()
+        for abbreviation in lookups:
+            expand(abbreviation)
+        results[f"{name}_ns"] = (time.perf_counter_ns() - start) / count
+
+    # check_abbreviation with a word that matches and one that does not
+    for name, word in (("check_hit", abbreviations[0]), ("check_miss", "zzqzzq")):
+        daemon.typing.reset()
+        for char in word:
+            daemon.matcher.feed(daemon.typing, char)
+        check = daemon.check_abbreviation
+        with quiet():
+            start = time.perf_counter_ns()
+            for _ in range(count // 10):
+                check()
+            results[f"{name}_ns"] = (time.perf_counter_ns() - start) / (count // 10)
+    daemon.typing.reset()
+    return results
+
+
+def run_devices(daemon, text, counts):
+    """Several keyboards typing at once, each with its own TypingState
+
+    Every keyboard types the same text, taking turns one keystroke at a time,
+    so each must expand exactly what a single keyboard does."""
+    groups = character_groups(key_events(text, keymap=daemon.keymap))
+    events = sum(len(group) for group in groups)
+
+    process = daemon.process_key_event
+    results = []
+    for count in counts:
+        states = [TypingState() for _ in range(count)]
+        injected = daemon.injected
+        with quiet():
+            start = time.perf_counter_ns()
+            for group in groups:
+                for typing in states:
+                    for event in group:
+                        process(event, typing)
+            elapsed = time.perf_counter_ns() - start
+        results.append({"devices": count, "ns_per_event": elapsed / (events * count),
+                        "expansions": daemon.injected - injected})
+    return results
+
+
+def run_scaling(daemon, sizes, keystrokes):
+    """ns/event against dictionary size, on a stream drawn from each dictionary"""
+    original = daemon.expansions, daemon.matcher
+    curve = []
+    for size in sizes:
+        expansions = synthetic_dictionary(size)
+        start = time.perf_counter()
+        daemon.use_dictionary(expansions)
+        build_ms = (time.perf_counter() - start) * 1000
+        events = key_events(synthetic_text(expansions, keystrokes))
+        result = run_flood(daemon, events, repeat=2)
+        curve.append({"size": size, "build_ms": build_ms, "ns_per_event": result["ns_per_event"]})
+    daemon.expansions, daemon.matcher = original
+    return curve
+
+
+def record(path, device_path, seconds):
+    """Record raw events from a device in the replay text format"""
+    device = evdev.InputDevice(device_path)
+    print(f"Recording {device.name} for {seconds} s - start typing...")
+    end = time.time() + seconds
+    count = 0
+    with open(path, "w") as f:
+        while time.time() < end:
+            event = device.read_one()
+            if event is None:
+                time.sleep(0.001)
+                continue
+            f.write(f"{event.sec} {event.usec} {event.type} {event.code} {event.value}\n")
+            count += 1
+    device.close()
+    print(f"Recorded {count} events to {path}")
+
+
+def load_events(path):
+    """Load the key events saved by --record ("sec usec type code value" per line)
+
+    Only EV_KEY events are kept, as the device reader passes on no others."""
+    events = []
+    with open(path) as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) == 5 and int(fields[2]) == evdev.ecodes.EV_KEY:
+                events.append(evdev.InputEvent(*map(int, fields)))
+    return events
+
+
+def run_dotool(script):
+    """Milliseconds for a one-shot dotool to run a script to completion"""
+    start = time.perf_counter()
+    subprocess.run(["dotool"], input=script, text=True, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def measure_paste_cutoff(lengths, shortcut="ctrl+v", repeat=3):
+    """Time-to-text for typing and for pasting expansions of each length
+
+    dotool exits only after its last key press, so the time of a one-shot run
+    minus that of an empty run is the time the text takes to appear."""
+    paster = ClipboardPaster(restore_delay=0.5)
+    if not paster.available():
+        print("Error: wl-copy/wl-paste or xclip is needed to measure pasting")
+        return None
+    print("Focus a scratch text field: text will be typed and pasted into it in 3 s...")
+    time.sleep(3)
+
+    baseline = min(run_dotool("") for _ in range(repeat))
+    words = "the quick brown fox jumps over the lazy dog " * 8
+    results = []
+    for length in lengths:
+        text = words[:length]
+        type_ms = min(run_dotool(f"type {text}\n") for _ in range(repeat)) - baseline
+        paste_times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            paster.prepare(text)
+            run_dotool(f"key {shortcut}\n")
+            paste_times.append((time.perf_counter() - start) * 1000 - baseline)
+            paster.schedule_restore()
+            time.sleep(paster.restore_delay + 0.1)
+        results.append({"length": length, "type_ms": type_ms, "paste_ms": min(paste_times)})
+        print(f"  {length:>4} chars: typed {type_ms:7.1f} ms, pasted {min(paste_times):7.1f} ms")
+
+    faster = [result["length"] for result in results if result["paste_ms"] < result["type_ms"]]
+    if faster:
+        print(f"Suggested \"paste_threshold\": {faster[0]}")
+    else:
+        print("Typing was faster at every length; set \"paste_threshold\": 0 to always type")
+    return results
+
+
+def compare(results, baseline_path):
+    """Print the change of every timing against a saved results file"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\nCompared with '{baseline.get('label', baseline_path)}':")
+    if baseline.get("benchmark_version") != BENCHMARK_VERSION:
+        print(f"  (baseline is from benchmark version {baseline.get('benchmark_version')}, "
+              f"this is {BENCHMARK_VERSION}: event streams differ)")
+    rows = [
+        ("flood ns/event", ("flood", "ns_per_event")),
+        ("paced ns/event", ("paced", "ns_per_event")),
+        ("expand hit ns", ("functions", "expand_hit_ns")),
+        ("expand miss ns", ("functions", "expand_miss_ns")),
+        ("check hit ns", ("functions", "check_hit_ns")),
+        ("check miss ns", ("functions", "check_miss_ns")),
+    ]
+    for name, (section, key) in rows:
+        old = baseline.get(section, {}).get(key)
+        new = results.get(section, {}).get(key)
+        if old and new:
+            print(f"  {name:16} {old:10.1f} -> {new:10.1f}  ({(new - old) / old * 100:+.1f}%)")
+
+
+# Command-line options that take a value, and the ones that do not
+VALUE_OPTIONS = {"--keystrokes", "--rate", "--seconds", "--sizes", "--devices", "--label",
+                 "--lengths", "--json", "--compare", "--record", "--device", "--events"}
+FLAG_OPTIONS = {"--paste-cutoff"}
+
+
+def argument_error(args):
+    """Message for the first unknown or incomplete argument, or None"""
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        if arg in VALUE_OPTIONS:
+            if index + 1 >= len(args) or args[index + 1].startswith("--"):
+                return f"{arg} needs a value"
+            index += 2
+        elif arg in FLAG_OPTIONS:
+            index += 1
+        else:
+            return f"unknown argument: {arg}"
+    return None
+
+
+def option(name, default):
+    """Value following --name on the command line"""
+    args = sys.argv[1:]
+    if name in args and args.index(name) + 1 < len(args):
+        return args[args.index(name) + 1]
+    return default
+
+
+def main():
+    """Run the benchmark suite"""
+    args = sys.argv[1:]
+    if "-h" in args or "--help" in args:
+        print(__doc__.strip())
+        return
+    error = argument_error(args)
+    if error:
+        print(f"Error: {error} (see --help)")
+        sys.exit(2)
+
+    keystrokes = int(option("--keystrokes", 20000))
+    rate = float(option("--rate", 8))
+    seconds = float(option("--seconds", 5))
+    sizes = [int(size) for size in option("--sizes", "1000,10000,100000").split(",")]
+    device_counts = [int(count) for count in option("--devices", "1,2,8,32").split(",")]
+
+    if "--record" in sys.argv[1:]:
+        record(option("--record", "events.txt"), option("--device", None), seconds)
+        return
+
+    if "--paste-cutoff" in sys.argv[1:]:
+        lengths = [int(length) for length in option("--lengths", "8,16,32,64,128").split(",")]
+        measure_paste_cutoff(lengths)
+        return
+
+    print("EIM Key Processing Benchmark")
+    print("=" * 40)
+    daemon = ReplayDaemon()
+
+    events_path = option("--events", None)
+    if events_path:
+        events = load_events(events_path)
+        stream = f"recording {events_path}"
+    else:
+        events = key_events(synthetic_text(daemon.expansions, keystrokes))
+        stream = f"synthetic, {keystrokes} keystrokes"
+    print(f"Dictionary: {len(daemon.expansions)} expansions ({daemon.matcher.pattern_count} hotstrings)")
+    print(f"Stream: {stream}, {len(events)} events")
+
+    results = {
+        "benchmark_version": BENCHMARK_VERSION,
+        "label": option("--label", time.strftime("%Y-%m-%d %H:%M:%S")),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "dictionary_size": len(daemon.expansions),
+        "stream": stream,
+    }
+
+    results["flood"] = run_flood(daemon, events)
+    print(f"Flood:   {results['flood']['ns_per_event']:.0f} ns/event, "
+          f"{results['flood']['events_per_s']:.0f} events/s "
+          f"({results['flood']['expansions']} expansions, injection stubbed)")
+
+    results["paced"] = run_paced(daemon, events, rate, seconds)
+    print(f"Paced:   {results['paced']['ns_per_event']:.0f} ns/event at {rate:g} keys/s "
+          f"(p50 {results['paced']['p50_ns']:.0f} ns, p99 {results['paced']['p99_ns']:.0f} ns)")
+
+    results["allocations"] = run_allocations(daemon, events)
+    print(f"Memory:  {results['allocations']['peak_bytes_per_event']:.1f} peak bytes/event, "
+          f"{results['allocations']['retained_blocks_per_event']:.3f} retained blocks/event")
+
+    results["functions"] = run_functions(daemon)
+    print("Calls:   " + ", ".join(f"{name} {value:.0f}" for name, value in results["functions"].items()))
+
+    results["devices"] = run_devices(daemon, synthetic_text(daemon.expansions, min(keystrokes, 5000)),
+                                     device_counts)
+    print("Devices:")
+    for point in results["devices"]:
+        per_device = point["expansions"] / point["devices"]
+        print(f"  {point['devices']:>8} keyboards: {point['ns_per_event']:.0f} ns/event "
+              f"({per_device:g} expansions per keyboard)")
+
+    results["scaling"] = run_scaling(daemon, sizes, min(keystrokes, 5000))
+    print("Scaling:")
+    for point in results["scaling"]:
+        print(f"  {point['size']:>8} expansions: {point['ns_per_event']:.0f} ns/event "
+              f"(built in {point['build_ms']:.0f} ms)")
+
+    json_path = option("--json", None)
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {json_path}")
+
+    baseline_path = option("--compare", None)
+    if baseline_path:
+        compare(results, baseline_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+# -*- coding: utf-8 -*-
+"""
+EIM Clipboard Watcher
+Delivers clipboard changes as events instead of polling the clipboard tools
+
+Watchers, in order of preference:
+- wl-paste --watch: one long-lived wl-paste process that runs a tiny command
+  for every new selection and passes it the content; the outputs arrive on a
+  pipe separated by NUL bytes
+- X11: an XFixes selection-owner notification on the CLIPBOARD selection
+  (over ctypes); the content is read with xclip only after it has changed
+- polling: wl-paste / xclip on a timer that backs off while the clipboard
+  stays the same, from the minimum to the maximum interval
+
+Every process spawned and every wake-up is counted, along with the CPU time
+of the watcher thread, so the cost of the fallback path can be measured.
+
+ClipboardPaster is the other direction: it puts a long expansion on the
+clipboard for a single paste shortcut and puts the user's text back afterwards.
+"""
+
+import ctypes
+import os
+import select
+import shutil
+import subprocess
+import threading
+import time
+
+# wl-paste runs this once per clipboard change, with the content on stdin;
+# each run starts WATCH_SPAWNS processes (sh and cat, printf is a shell builtin)
+WATCH_COMMAND = ['sh', '-c', 'cat; printf "\\0"']
+WATCH_SPAWNS = 2
+
+# Clipboard tools, in order of preference
+READ_COMMANDS = (['wl-paste', '--no-newline', '--type', 'text'],
+                 ['xclip', '-o', '-selection', 'clipboard'])
+WRITE_COMMANDS = (['wl-copy', '--type', 'text/plain'],
+                  ['xclip', '-i', '-selection', 'clipboard'])
+
+# XFixesSetSelectionOwnerNotifyMask, XFixesSelectionNotify
+SELECTION_OWNER_NOTIFY_MASK = 1
+SELECTION_NOTIFY = 0
+
+
+class ClipboardWatcher:
+    """Calls on_change(text) on a background thread whenever the clipboard changes"""
+
+    def __init__(self, on_change, mode="auto", min_interval=0.5, max_interval=8.0):
+        self.on_change = on_change
+        self.requested_mode = mode
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.mode = None
+        self.process = None
+        self.stop_event = threading.Event()
+        self.thread = None
+        # close() writes a byte here to wake the X11 watcher's select()
+        self.wakeup_pipe = os.pipe()
+        os.set_blocking(self.wakeup_pipe[1], False)
+
+        # Statistics
+        self.spawns = 0
+        self.wakeups = 0
+        self.changes = 0
+        self.restarts = 0
+        self.cpu_seconds = 0.0
+
+    def start(self):
+        """Pick a watcher and run it on a daemon thread"""
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        """Stop the watcher and its wl-paste process"""
+        self.stop_event.set()
+        try:
+            os.write(self.wakeup_pipe[1], b"\0")
+        except OSError:
+            pass
+        process = self.process
+        if process is not None:
+            try:
+                process.terminate()
+                process.wait(timeout=1)
+            except Exception:
+                pass
+
+    def stats(self):
+        """Counters for the status output and control socket"""
+        return {
+            "mode": self.mode,
+            "spawns": self.spawns,
+            "wakeups": self.wakeups,
+            "changes": self.changes,
+            "restarts": self.restarts,
+            "cpu_ms": round(self.cpu_seconds * 1000, 3),
+        }
+
+    def _run(self):
+        backoff = self.min_interval
+        while not self.stop_event.is_set():
+            mode = self._choose_mode()
+            self.mode = mode
+            started = time.monotonic()
+            try:
+                if mode == "wl-paste":
+                    self._watch_wl_paste()
+                elif mode == "x11":
+                    self._watch_x11()
+                else:
+                    self._poll()
+            except Exception as e:
+                print(f"Error in clipboard watcher ({mode}): {e}")
+            finally:
+                self.cpu_seconds = time.thread_time()
+
+            if self.stop_event.is_set():
+                break
+            # The watcher ended (compositor restarted, X server gone): retry with backoff
+            self.restarts += 1
+            if time.monotonic() - started > self.max_interval:
+                backoff = self.min_interval
+            self.stop_event.wait(backoff)
+            backoff = min(backoff * 2, self.max_interval)
+
+    def _choose_mode(self):
+        mode = self.requested_mode
+        if mode in ("auto", "wl-paste") and os.environ.get("WAYLAND_DISPLAY") and shutil.which("wl-paste"):
+            return "wl-paste"
+        if mode in ("auto", "x11") and os.environ.get("DISPLAY") and shutil.which("xclip"):
+            # Only the first call in the process looks the libraries up; count what it spawned
+            lookups = _XFixes.lookups
+            available = _XFixes.available()
+            self.spawns += _XFixes.lookups - lookups
+            if available:
+                return "x11"
+        return "poll"
+
+    def _changed(self, text):
+        self.changes += 1
+        self.on_change(text)
+
+    def _watch_wl_paste(self):
+        """One wl-paste process for the lifetime of the watcher"""
+        self.process = subprocess.Popen(
+            ['wl-paste', '--type', 'text', '--watch'] + WATCH_COMMAND,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        self.spawns += 1
+        pending = b""
+        try:
+            while not self.stop_event.is_set():
+                data = self.process.stdout.read1(65536)
+                self.wakeups += 1
+                if not data:
+                    break
+                pending += data
+                *contents, pending = pending.split(b"\0")
+                for content in contents:
+                    self.spawns += WATCH_SPAWNS
+                    self._changed(content.decode('utf-8', errors='replace').strip())
+                self.cpu_seconds = time.thread_time()
+        finally:
+            process, self.process = self.process, None
+            try:
+                process.terminate()
+                process.wait(timeout=1)
+            except Exception:
+                pass
+
+    def _watch_x11(self):
+        """Sleep on the X connection until the CLIPBOARD owner changes"""
+        xfixes = _XFixes()
+        try:
+            while not self.stop_event.is_set():
+                # No timeout: close() wakes this up through the pipe
+                ready, _, _ = select.select([xfixes.fd, self.wakeup_pipe[0]], [], [])
+                self.wakeups += 1
+                if xfixes.fd in ready and xfixes.owner_changed():
+                    self._changed(self.read())
+                self.cpu_seconds = time.thread_time()
+        finally:
+            xfixes.close()
+
+    def _poll(self):
+        """Read the clipboard on a timer, backing off while it stays the same"""
+        interval = self.min_interval
+        last = None
+        while not self.stop_event.wait(interval):
+            self.wakeups += 1
+            text = self.read()
+            if text != last:
+                last = text
+                interval = self.min_interval
+                self._changed(text)
+            else:
+                interval = min(interval * 2, self.max_interval)
+            self.cpu_seconds = time.thread_time()
+
+    def read(self):
+        """Current clipboard text from wl-paste or xclip ("" if neither works)"""
+        for command in READ_COMMANDS:
+            if not shutil.which(command[0]):
+                continue
+            try:
+                self.spawns += 1
+                result = subprocess.run(command, capture_output=True, text=True, timeout=1)
+                if result.returncode == 0:
+                    return result.stdout.strip()
+            except (subprocess.TimeoutExpired, OSError):
+                pass
+        return ""
+
+
+class ClipboardPaster:
+    """Swap an expansion onto the clipboard for one paste, then restore the user's text
+
+    Only text is saved and restored. A paste that starts before the previous
+    restore has happened keeps the originally saved text.
+    """
+
+    def __init__(self, restore_delay=0.3):
+        self.restore_delay = restore_delay
+        self.saved = None
+        self.timer = None
+        self.lock = threading.Lock()
+        # Clipboard changes before this time (monotonic) are our own
+        self.quiet_until = 0.0
+        self.write_command = next((command for command in WRITE_COMMANDS if shutil.which(command[0])), None)
+        self.read_command = next((command for command in READ_COMMANDS if shutil.which(command[0])), None)
+
+        # Statistics
+        self.pastes = 0
+        self.restores = 0
+        self.failures = 0
+
+    def available(self):
+        return self.write_command is not None and self.read_command is not None
+
+    def own_change(self):
+        """True while clipboard changes are the paster's own writes"""
+        return time.monotonic() < self.quiet_until
+
+    def prepare(self, text):
+        """Save the current clipboard and replace it with text; False if that failed"""
+        with self.lock:
+            self.quiet_until = time.monotonic() + self.restore_delay + 1.0
+            if self.timer is not None:
+                # Still holding an earlier expansion: the saved text is the user's
+                self.timer.cancel()
+                self.timer = None
+            else:
+                self.saved = self._run(self.read_command)
+            if self._run(self.write_command, text) is None:
+                self.failures += 1
+                return False
+            self.pastes += 1
+            return True
+
+    def schedule_restore(self):
+        """Put the saved text back once the application has had time to paste"""
+        with self.lock:
+            self.timer = threading.Timer(self.restore_delay, self._restore)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def _restore(self):
+        with self.lock:
+            self.timer = None
+            self.quiet_until = time.monotonic() + 1.0
+            if self.saved is not None:
+                self._run(self.write_command, self.saved)
+                self.restores += 1
+            self.saved = None
+
+    def close(self):
+        """Restore right away if a restore is still pending"""
+        with self.lock:
+            timer = self.timer
+        if timer is not None:
+            timer.cancel()
+            self._restore()
+
+    @staticmethod
+    def _run(command, text=None):
+        """Read the clipboard (text=None) or write text to it; None if the tool failed"""
+        try:
+            if text is None:
+                result = subprocess.run(command, capture_output=True, text=True, timeout=1)
+                return result.stdout if result.returncode == 0 else None
+            # wl-copy and xclip stay behind to serve the selection: never wait on their output
+            result = subprocess.run(command, input=text, text=True, timeout=1,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return "" if result.returncode == 0 else None
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+
+
+class _XFixes:
+    """CLIPBOARD owner-change notifications from the X server"""
+
+    # Tried first: dlopen() finds these without spawning anything
+    SONAMES = ("libX11.so.6", "libXfixes.so.3")
+    # find_library() calls made so far; each one may spawn ldconfig
+    lookups = 0
+    # (libX11, libXfixes) once loaded, False if they are missing
+    _loaded = None
+
+    @classmethod
+    def _libraries(cls):
+        """libX11 and libXfixes, looked up once per process, or None"""
+        if cls._loaded is None:
+            cls._loaded = cls._load() or False
+        return cls._loaded or None
+
+    @classmethod
+    def _load(cls):
+        try:
+            return tuple(ctypes.CDLL(name) for name in cls.SONAMES)
+        except OSError:
+            pass
+        # Imported here: only the X11 watcher needs it
+        from ctypes.util import find_library
+        paths = []
+        for name in ("X11", "Xfixes"):
+            cls.lookups += 1
+            paths.append(find_library(name))
+        if not all(paths):
+            return None
+        try:
+            return tuple(ctypes.CDLL(path) for path in paths)
+        except OSError:
+            return None
+
+    @classmethod
+    def available(cls):
+        return cls._libraries() is not None
+
+    def __init__(self):
+        libraries = self._libraries()
+        if libraries is None:
+            raise OSError("libX11 or libXfixes not found")
+        self.x11, self.xfixes = libraries
+        self.x11.XOpenDisplay.restype = ctypes.c_void_p
+        self.x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        self.x11.XDefaultRootWindow.restype = ctypes.c_ulong
+        self.x11.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        self.x11.XInternAtom.restype = ctypes.c_ulong
+        self.x11.XInternAtom.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+        self.x11.XConnectionNumber.argtypes = [ctypes.c_void_p]
+        self.x11.XPending.argtypes = [ctypes.c_void_p]
+        self.x11.XNextEvent.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        self.x11.XFlush.argtypes = [ctypes.c_void_p]
+        self.x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        self.xfixes.XFixesQueryExtension.argtypes = [
+            ctypes.c_void_p, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int)]
+        self.xfixes.XFixesSelectSelectionInput.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong]
+
+        self.display = self.x11.XOpenDisplay(None)
+        if not self.display:
+            raise OSError("Cannot open the X display")
+        event_base = ctypes.c_int()
+        error_base = ctypes.c_int()
+        if not self.xfixes.XFixesQueryExtension(self.display, ctypes.byref(event_base), ctypes.byref(error_base)):
+            self.close()
+            raise OSError("The X server has no XFixes extension")
+        self.notify_type = event_base.value + SELECTION_NOTIFY
+
+        clipboard = self.x11.XInternAtom(self.display, b"CLIPBOARD", 0)
+        root = self.x11.XDefaultRootWindow(self.display)
+        self.xfixes.XFixesSelectSelectionInput(self.display, root, clipboard, SELECTION_OWNER_NOTIFY_MASK)
+        self.x11.XFlush(self.display)
+        self.fd = self.x11.XConnectionNumber(self.display)
+        # XEvent is a union padded to 24 longs; the type is its first int
+        self.event = ctypes.create_string_buffer(24 * ctypes.sizeof(ctypes.c_long))
+
+    def owner_changed(self):
+        """Drain queued events; True if any was a CLIPBOARD owner change"""
+        changed = False
+        while self.x11.XPending(self.display):
+            self.x11.XNextEvent(self.display, self.event)
+            if ctypes.c_int.from_buffer(self.event).value == self.notify_type:
+                changed = True
+        return changed
+
+    def close(self):
+        if self.display:
+            self.x11.XCloseDisplay(self.display)
+            self.display = None
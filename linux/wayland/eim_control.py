@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+EIM Control Socket
+Local Unix-domain socket for querying and controlling the running daemon
+
+Protocol: one JSON object per line in each direction.
+Request:  {"command": "status"}            {"command": "history", "count": 20}
+Response: {"ok": true, "result": {...}}    {"ok": false, "error": "..."}
+
+Each connection is served on its own thread, so queries never block the
+keyboard reader or the injector.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+
+
+def default_socket_path():
+    """$XDG_RUNTIME_DIR/eim/control.sock, or a per-user path under /tmp"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "eim", "control.sock")
+    return os.path.join("/tmp", f"eim-{os.getuid()}", "control.sock")
+
+
+def check_private_dir(path):
+    """Raise OSError unless path is a real directory owned by us with mode 0700
+
+    /tmp is shared, so another user could have created /tmp/eim-<uid> first.
+    """
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise OSError(f"{path} is not a directory")
+    if info.st_uid != os.getuid():
+        raise OSError(f"{path} is owned by uid {info.st_uid}, not {os.getuid()}")
+    if stat.S_IMODE(info.st_mode) != 0o700:
+        raise OSError(f"{path} has mode {stat.S_IMODE(info.st_mode):o}, expected 700")
+
+
+class _ControlHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.dispatch(line)
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b"\n")
+            self.wfile.flush()
+
+
+class _ThreadingUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class ControlServer:
+    """Serve commands from {name: handler(request) -> result} on a Unix socket"""
+
+    def __init__(self, handlers, path=None):
+        self.handlers = handlers
+        self.path = path or default_socket_path()
+        self.server = None
+        self.thread = None
+
+    def start(self):
+        """Bind the socket (owner-only) and serve it on a background thread"""
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        check_private_dir(os.path.dirname(self.path))
+        if os.path.exists(self.path):
+            # A stale socket from a crashed daemon; refuse if one is still answering
+            try:
+                send_command("ping", path=self.path, timeout=0.5)
+                raise OSError(f"Another daemon is already listening on {self.path}")
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(self.path)
+
+        old_umask = os.umask(0o177)
+        try:
+            self.server = _ThreadingUnixServer(self.path, _ControlHandler)
+        finally:
+            os.umask(old_umask)
+        self.server.dispatch = self.dispatch
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def dispatch(self, line):
+        """Run one request line and build its response"""
+        try:
+            request = json.loads(line)
+            command = request.get("command", "")
+            handler = self.handlers.get(command)
+            if handler is None:
+                return {"ok": False, "error": f"Unknown command: {command}",
+                        "commands": sorted(self.handlers)}
+            return {"ok": True, "result": handler(request)}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def close(self):
+        """Stop serving and remove the socket file, if this server bound it"""
+        if self.server is None:
+            # start() failed or never ran: the path may belong to another daemon
+            return
+        self.server.shutdown()
+        self.server.server_close()
+        self.server = None
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+def send_command(command, path=None, timeout=5.0, **arguments):
+    """Send one command to the daemon and return its decoded response"""
+    request = dict(arguments, command=command)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path or default_socket_path())
+        sock.sendall(json.dumps(request).encode('utf-8') + b"\n")
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    return json.loads(data)
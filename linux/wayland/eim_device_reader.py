@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+EIM Device Reader
+Kernel-filtered, frame-at-a-time reads from an evdev keyboard
+
+EVIOCSMASK tells the kernel which event types and key codes this client
+wants, so EV_MSC scancodes, LED echoes and keys that type nothing are dropped
+before they are copied to user space. Reads then pull every queued event
+with one read() call and hand back the key events of complete SYN_REPORT
+frames; only those are turned into evdev InputEvent objects.
+
+Events the kernel filters out never reach the process and cannot be
+counted, so the saving shows up as fewer delivered events (and reads) per
+key press.
+"""
+
+import ctypes
+import fcntl
+import os
+import struct
+
+# Event types and codes from <linux/input-event-codes.h>
+EV_SYN = 0x00
+EV_KEY = 0x01
+EV_CNT = 0x20
+KEY_CNT = 0x300
+SYN_REPORT = 0
+SYN_DROPPED = 3
+
+# struct input_event: struct timeval, __u16 type, __u16 code, __s32 value
+INPUT_EVENT = struct.Struct("llHHi")
+# struct input_mask: __u32 type, __u32 codes_size, __u64 codes_ptr
+INPUT_MASK = struct.Struct("IIQ")
+# _IOW('E', 0x93, struct input_mask)
+EVIOCSMASK = (1 << 30) | (INPUT_MASK.size << 16) | (ord('E') << 8) | 0x93
+
+# Events fetched per read() call
+READ_BATCH = 64
+
+
+def _bitmap(codes, count):
+    """Kernel bitmap (array of longs) with the given bits set"""
+    buffer = bytearray((count + 7) // 8)
+    for code in codes:
+        buffer[code // 8] |= 1 << (code % 8)
+    return ctypes.create_string_buffer(bytes(buffer), len(buffer))
+
+
+def set_event_mask(fd, key_codes):
+    """Deliver only EV_SYN and the given EV_KEY codes on this file descriptor"""
+    # Type 0 selects which event types are delivered at all (like EVIOCGBIT)
+    for mask_type, codes, count in ((0, (EV_SYN, EV_KEY), EV_CNT), (EV_KEY, key_codes, KEY_CNT)):
+        bitmap = _bitmap(codes, count)
+        fcntl.ioctl(fd, EVIOCSMASK, INPUT_MASK.pack(mask_type, len(bitmap), ctypes.addressof(bitmap)))
+
+
+class DeviceReader:
+    """Batched reader for one evdev device"""
+
+    def __init__(self, device, key_codes, event_class, state=None):
+        self.device = device
+        self.fd = device.fd
+        self.event_class = event_class
+        # Per-device state owned by the caller (the daemon's typing state)
+        self.state = state
+        # Key events of the frame still being read
+        self.frame = []
+        # After SYN_DROPPED, events up to and including the next SYN_REPORT are invalid
+        self.discarding = False
+        # Set when the kernel dropped events; the caller must resynchronise
+        self.dropped = False
+        self.filtered = False
+        self.reads = 0
+        self.delivered = 0
+        self.frames = 0
+        self.key_events = 0
+        self.drops = 0
+
+        try:
+            set_event_mask(self.fd, key_codes)
+            self.filtered = True
+        except OSError as e:
+            # Kernels before 4.4 have no EVIOCSMASK; every event is still handled correctly
+            print(f"Warning: No kernel event filtering for {device.name}: {e}")
+
+    def read(self):
+        """Key events of every complete frame waiting on the device
+
+        Raises BlockingIOError when nothing is queued and OSError when the
+        device has gone away, like InputDevice.read().
+        """
+        data = os.read(self.fd, INPUT_EVENT.size * READ_BATCH)
+        self.reads += 1
+        self.delivered += len(data) // INPUT_EVENT.size
+
+        events = []
+        frame = self.frame
+        for sec, usec, event_type, code, value in INPUT_EVENT.iter_unpack(data):
+            if event_type == EV_KEY:
+                if not self.discarding:
+                    frame.append(self.event_class(sec, usec, event_type, code, value))
+            elif event_type == EV_SYN:
+                if code == SYN_REPORT:
+                    if self.discarding:
+                        self.discarding = False
+                    else:
+                        events.extend(frame)
+                        self.frames += 1
+                    frame.clear()
+                elif code == SYN_DROPPED:
+                    # The kernel buffer overflowed: this frame is incomplete
+                    frame.clear()
+                    self.discarding = True
+                    self.drops += 1
+                    self.dropped = True
+        self.key_events += len(events)
+        return events
+
+    def stats(self):
+        """Per-device counters"""
+        return {
+            "name": self.device.name,
+            "path": self.device.path,
+            "kernel_filter": self.filtered,
+            "reads": self.reads,
+            "delivered_events": self.delivered,
+            "frames": self.frames,
+            "key_events": self.key_events,
+            "ignored_events": self.delivered - self.key_events - self.frames,
+            "dropped_frames": self.drops,
+        }
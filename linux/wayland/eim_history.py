@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+EIM Expansion History
+Fixed-size in-memory ring of recent expansions plus an optional on-disk log
+
+History records are small tuples that are only formatted when displayed.
+The on-disk log is append-only JSON lines: records are handed to a writer
+thread that writes them in batches and rotates the file by size, so the
+thread that performed the expansion never waits for the disk (and nothing
+is ever fsynced).
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+# Field positions in a history record
+TIME, ABBREVIATION, EXPANSION, METHOD, LATENCY_MS = range(5)
+
+
+class ExpansionHistory:
+    """Ring buffer of (timestamp, abbreviation, expansion, method, latency_ms) records"""
+
+    def __init__(self, size=100):
+        self.size = max(1, size)
+        self.records = [None] * self.size
+        self.next = 0
+        self.total = 0
+
+    def append(self, timestamp, abbreviation, expansion, method, latency_ms=None):
+        """Store one record, overwriting the oldest when full (O(1)); returns the record"""
+        # Abbreviations repeat constantly; interning shares one string per abbreviation
+        record = (timestamp, sys.intern(abbreviation), expansion, method, latency_ms)
+        self.records[self.next] = record
+        self.next = (self.next + 1) % self.size
+        self.total += 1
+        return record
+
+    def __len__(self):
+        return min(self.total, self.size)
+
+    def recent(self, count=None):
+        """Most recent records, oldest first"""
+        length = len(self)
+        count = length if count is None else max(0, min(count, length))
+        start = (self.next - count) % self.size
+        return [self.records[(start + index) % self.size] for index in range(count)]
+
+    @staticmethod
+    def format(record):
+        """Human-readable line for one record"""
+        timestamp = time.strftime("%H:%M:%S", time.localtime(record[TIME]))
+        line = f"[{timestamp}] {record[ABBREVIATION]} → {record[EXPANSION]} ({record[METHOD]}"
+        if record[LATENCY_MS] is not None:
+            line += f", {record[LATENCY_MS]:.1f} ms"
+        return line + ")"
+
+
+class ExpansionLog:
+    """Append-only JSON-lines log written in batches by a background thread"""
+
+    def __init__(self, path, max_bytes=10 * 1024 * 1024, backups=5, flush_interval=2.0):
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_interval = flush_interval
+        # deque.append and popleft are atomic, so producers never take a lock
+        self.pending = deque()
+        self.written = 0
+        self.rotations = 0
+        self.errors = 0
+        self.wakeup = threading.Event()
+        self.stopping = False
+        self.thread = None
+
+    def start(self):
+        """Start the writer thread"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def append(self, record):
+        """Queue a history record for the log; never blocks"""
+        self.pending.append(record)
+
+    def _run(self):
+        while not self.stopping:
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+            self.flush()
+        self.flush()
+
+    def flush(self):
+        """Write every queued record in one batch"""
+        lines = []
+        while self.pending:
+            record = self.pending.popleft()
+            lines.append(json.dumps({
+                "time": round(record[TIME], 3),
+                "abbreviation": record[ABBREVIATION],
+                "method": record[METHOD],
+                "latency_ms": None if record[LATENCY_MS] is None else round(record[LATENCY_MS], 3),
+            }, ensure_ascii=False))
+        if not lines:
+            return
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+                size = f.tell()
+            self.written += len(lines)
+            if size >= self.max_bytes:
+                self.rotate()
+        except OSError as e:
+            self.errors += 1
+            print(f"Warning: Could not write expansion log: {e}")
+
+    def rotate(self):
+        """log -> log.1 -> log.2 ... keeping `backups` old files"""
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.rotations += 1
+
+    def close(self):
+        """Write what is still queued and stop the writer thread"""
+        self.stopping = True
+        self.wakeup.set()
+        if self.thread is not None:
+            self.thread.join(timeout=5)
+            self.thread = None
+        else:
+            self.flush()
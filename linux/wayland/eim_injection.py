@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+EIM Text Injection
+Backends that type expansions: a long-lived dotool process, or a uinput
+virtual keyboard written to directly
+
+dotool reads one command per line from stdin, so the daemon can reuse the same
+child for every expansion instead of spawning a new process per key press.
+The BackSpaces for the abbreviation and the typed expansion are sent as one
+batched write.
+
+The uinput backend needs no child process: every character is turned into
+precomputed input_event records (Shift, key down/up, SYN) from the keymap,
+and an injection is a single write() to the virtual keyboard. Characters the
+keymap cannot type are handed to dotool, when it is installed.
+
+Both backends share one interface: build_commands(delete_count, text) and
+build_paste(shortcut) build what send() writes, and replace(delete_count,
+text) sends an abbreviation's BackSpaces and its expansion in one write.
+"""
+
+import os
+import struct
+import subprocess
+import threading
+import time
+
+try:
+    import evdev
+except ImportError:
+    evdev = None
+
+from eim_keymap import KEY_LEFTSHIFT
+
+# struct input_event: struct timeval, __u16 type, __u16 code, __s32 value
+INPUT_EVENT = struct.Struct("llHHi")
+EV_SYN, EV_KEY = 0x00, 0x01
+KEY_BACKSPACE, KEY_TAB, KEY_ENTER, KEY_SPACE = 14, 15, 28, 57
+UINPUT_DEVICE_NAME = "EIM virtual keyboard"
+
+# Modifier names accepted in shortcuts such as "ctrl+shift+v"
+SHORTCUT_MODIFIERS = {"ctrl": 29, "shift": KEY_LEFTSHIFT, "alt": 56, "super": 125}
+
+
+class DotoolSession:
+    """Long-lived dotool child process fed over stdin"""
+
+    name = "dotool"
+
+    def __init__(self, command=None):
+        self.command = command or ['dotool']
+        self.process = None
+        self.lock = threading.Lock()
+
+        # Statistics
+        self.restarts = 0
+        self.injections = 0
+        self.failures = 0
+        self.last_injection_ms = 0.0
+        self.total_injection_ms = 0.0
+
+    def is_alive(self):
+        """Check if the dotool child is running"""
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        """Start (or restart) the dotool child process"""
+        if self.process is not None:
+            self.restarts += 1
+            self._terminate()
+
+        self.process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+        )
+
+    def close(self):
+        """Close stdin and wait for the dotool child to exit"""
+        with self.lock:
+            self._terminate()
+            self.process = None
+
+    def _terminate(self):
+        """Stop the current child process without touching statistics"""
+        process = self.process
+        if process is None:
+            return
+        try:
+            if process.stdin:
+                process.stdin.close()
+        except Exception:
+            pass
+        try:
+            process.wait(timeout=1)
+        except Exception:
+            try:
+                process.kill()
+                process.wait(timeout=1)
+            except Exception:
+                pass
+
+    @staticmethod
+    def build_commands(delete_count=0, text=""):
+        """Build the dotool command script for one injection"""
+        lines = []
+        if delete_count > 0:
+            lines.append("key " + " ".join(["BackSpace"] * delete_count))
+
+        # dotool reads one command per line, so newlines become Return presses
+        for index, line in enumerate(text.split("\n")):
+            if index:
+                lines.append("key Return")
+            if line:
+                lines.append(f"type {line}")
+
+        return "".join(line + "\n" for line in lines)
+
+    @staticmethod
+    def build_paste(shortcut="ctrl+v"):
+        """dotool command pressing the paste shortcut"""
+        return f"key {shortcut}\n"
+
+    def send(self, commands):
+        """Write a command script to dotool, restarting the child if it died"""
+        if not commands:
+            return True
+
+        start = time.perf_counter()
+        with self.lock:
+            for attempt in range(2):
+                try:
+                    if not self.is_alive():
+                        self.start()
+                    self.process.stdin.write(commands)
+                    self.process.stdin.flush()
+                    break
+                except (BrokenPipeError, OSError, ValueError) as e:
+                    # The child died between injections; restart once and retry
+                    if attempt:
+                        self.failures += 1
+                        print(f"Error writing to dotool: {e}")
+                        return False
+                    self._terminate()
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.injections += 1
+        self.last_injection_ms = elapsed_ms
+        self.total_injection_ms += elapsed_ms
+        return True
+
+    def replace(self, delete_count, text):
+        """Delete the typed abbreviation and type its expansion in one write"""
+        return self.send(self.build_commands(delete_count, text))
+
+    def average_injection_ms(self):
+        """Average time spent writing one injection"""
+        if not self.injections:
+            return 0.0
+        return self.total_injection_ms / self.injections
+
+
+class UinputSession:
+    """Virtual keyboard on /dev/uinput, typing precomputed key event sequences"""
+
+    name = "uinput"
+
+    def __init__(self, keymap, fallback=None, key_delay=0.0):
+        self.keymap = keymap
+        # DotoolSession for text the keymap cannot type (None: such text fails)
+        self.fallback = fallback
+        # Seconds between key presses; 0 writes the whole injection at once
+        self.key_delay = key_delay
+        self.device = None
+        self.lock = threading.Lock()
+
+        # char -> bytes of its complete key press
+        self.sequences = {}
+        for char, (code, shift) in keymap.keystrokes.items():
+            self.sequences[char] = self._press(code, shift)
+        self.sequences[" "] = self._press(KEY_SPACE)
+        self.sequences["\n"] = self._press(KEY_ENTER)
+        self.sequences["\t"] = self._press(KEY_TAB)
+        self.backspace = self._press(KEY_BACKSPACE)
+
+        # Statistics
+        self.restarts = 0
+        self.injections = 0
+        self.failures = 0
+        self.fallbacks = 0
+        self.last_injection_ms = 0.0
+        self.total_injection_ms = 0.0
+
+    @staticmethod
+    def _press(code, shift=False):
+        """input_event records for one key press (the kernel sets the timestamps)"""
+        events = [(EV_KEY, code, 1), (EV_SYN, 0, 0), (EV_KEY, code, 0), (EV_SYN, 0, 0)]
+        if shift:
+            events = ([(EV_KEY, KEY_LEFTSHIFT, 1), (EV_SYN, 0, 0)] + events
+                      + [(EV_KEY, KEY_LEFTSHIFT, 0), (EV_SYN, 0, 0)])
+        return b"".join(INPUT_EVENT.pack(0, 0, *event) for event in events)
+
+    def is_alive(self):
+        """Check if the virtual keyboard exists"""
+        return self.device is not None
+
+    def start(self):
+        """Create (or recreate) the virtual keyboard"""
+        if evdev is None:
+            raise OSError("evdev is required for the uinput backend")
+        if self.device is not None:
+            self.restarts += 1
+            self._destroy()
+
+        codes = {code for code, shift in self.keymap.keystrokes.values()}
+        codes.update((KEY_BACKSPACE, KEY_TAB, KEY_ENTER, KEY_SPACE))
+        codes.update(SHORTCUT_MODIFIERS.values())
+        self.device = evdev.UInput({evdev.ecodes.EV_KEY: sorted(codes)}, name=UINPUT_DEVICE_NAME)
+        # The compositor needs a moment to pick up a new keyboard before it is used
+        time.sleep(0.2)
+
+    def close(self):
+        """Destroy the virtual keyboard"""
+        with self.lock:
+            self._destroy()
+        if self.fallback is not None:
+            self.fallback.close()
+
+    def _destroy(self):
+        device = self.device
+        self.device = None
+        if device is not None:
+            try:
+                device.close()
+            except Exception:
+                pass
+
+    def build_commands(self, delete_count=0, text=""):
+        """Event bytes for one injection, or a dotool script if the keymap cannot type the text"""
+        try:
+            typed = b"".join(self.sequences[char] for char in text)
+        except KeyError:
+            return DotoolSession.build_commands(delete_count, text)
+        return self.backspace * delete_count + typed
+
+    def build_paste(self, shortcut="ctrl+v"):
+        """Event bytes pressing the paste shortcut, e.g. ctrl+v or ctrl+shift+v"""
+        *modifiers, key = shortcut.lower().split("+")
+        codes = [SHORTCUT_MODIFIERS[name] for name in modifiers]
+        # The key that types this character on the layout, as applications match it by keysym
+        codes.append(self.keymap.keystrokes[key][0])
+        events = []
+        for code in codes:
+            events += [(EV_KEY, code, 1), (EV_SYN, 0, 0)]
+        for code in reversed(codes):
+            events += [(EV_KEY, code, 0), (EV_SYN, 0, 0)]
+        return b"".join(INPUT_EVENT.pack(0, 0, *event) for event in events)
+
+    def send(self, commands):
+        """Write event bytes to the virtual keyboard (dotool scripts go to the fallback)"""
+        if not commands:
+            return True
+        if isinstance(commands, str):
+            self.fallbacks += 1
+            if self.fallback is None:
+                self.failures += 1
+                print("Error: text needs characters the keyboard layout cannot type (dotool not installed)")
+                return False
+            return self.fallback.send(commands)
+
+        start = time.perf_counter()
+        with self.lock:
+            try:
+                if not self.is_alive():
+                    self.start()
+                fd = self.device.fd
+                if self.key_delay > 0:
+                    # One SYN-terminated event record at a time, paced for slow applications
+                    step = INPUT_EVENT.size * 2
+                    for offset in range(0, len(commands), step):
+                        os.write(fd, commands[offset:offset + step])
+                        time.sleep(self.key_delay)
+                else:
+                    view = memoryview(commands)
+                    while view:
+                        view = view[os.write(fd, view):]
+            except OSError as e:
+                self.failures += 1
+                print(f"Error writing to uinput: {e}")
+                self._destroy()
+                return False
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.injections += 1
+        self.last_injection_ms = elapsed_ms
+        self.total_injection_ms += elapsed_ms
+        return True
+
+    def replace(self, delete_count, text):
+        """Delete the typed abbreviation and type its expansion in one write"""
+        return self.send(self.build_commands(delete_count, text))
+
+    def average_injection_ms(self):
+        """Average time spent writing one injection"""
+        if not self.injections:
+            return 0.0
+        return self.total_injection_ms / self.injections
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+EIM Input Device Enumeration
+Lists and classifies input devices from sysfs without opening them
+
+Everything needed to decide which /dev/input/event* nodes are keyboards is in
+/sys/class/input: the name, phys and uniq strings, the bus/vendor/product ids
+and the capability bitmaps. Reading them needs no permissions on the device
+nodes, so only the devices that are selected are ever opened.
+
+Descriptions are cached per device node (st_dev, st_ino, st_mtime of
+/dev/input/eventN), so on a repeat startup a known device costs one stat()
+and no sysfs reads.
+"""
+
+import json
+import os
+import struct
+from collections import namedtuple
+
+SYSFS_INPUT = "/sys/class/input"
+DEV_INPUT = "/dev/input"
+CACHE_VERSION = 2
+
+# Event types and codes from <linux/input-event-codes.h>
+EV_KEY, EV_REL, EV_ABS = 0x01, 0x02, 0x03
+KEY_ENTER, KEY_BACKSPACE, KEY_A, KEY_SPACE = 28, 14, 30, 57
+REL_X, REL_Y = 0x00, 0x01
+ABS_X = 0x00
+
+# Capability bitmaps are printed as space-separated longs, most significant first
+BITS_PER_LONG = struct.calcsize("l") * 8
+
+InputDeviceInfo = namedtuple("InputDeviceInfo", [
+    "path", "identity", "name", "phys", "uniq", "bustype", "vendor", "product", "version",
+    "categories", "key_count", "rel_count", "abs_count",
+])
+
+
+def default_cache_path():
+    """$XDG_CACHE_HOME/eim/input_devices.json"""
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_dir, "eim", "input_devices.json")
+
+
+def _read(path, default=""):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return default
+
+
+def _bitmap(text):
+    """Integer with the bits of a sysfs capability bitmap"""
+    value = 0
+    for word in text.split():
+        value = (value << BITS_PER_LONG) | int(word, 16)
+    return value
+
+
+def _has(bitmap, code):
+    return bool((bitmap >> code) & 1)
+
+
+def classify(ev, key, rel, abs_):
+    """Device categories from capability bitmaps (a device can be in several)"""
+    categories = []
+    if _has(ev, EV_KEY):
+        if any(_has(key, code) for code in (KEY_A, KEY_SPACE, KEY_ENTER, KEY_BACKSPACE)):
+            categories.append("keyboards")
+        else:
+            categories.append("other")
+    if _has(ev, EV_REL) and _has(rel, REL_X):
+        categories.append("mice" if _has(rel, REL_Y) else "touchpads")
+    if _has(ev, EV_ABS) and _has(abs_, ABS_X):
+        categories.append("gamepads")
+    return categories or ["other"]
+
+
+def _node_key(event_name):
+    """Cache key for /dev/input/eventN: (st_dev, st_ino, st_mtime) of the node, or None
+
+    udev creates a new node for every device that is plugged in, so a known
+    key means the same device and nothing in sysfs needs to be read again.
+    """
+    try:
+        info = os.stat(os.path.join(DEV_INPUT, event_name))
+    except OSError:
+        return None
+    return f"{info.st_dev}:{info.st_ino}:{info.st_mtime_ns}"
+
+
+def _read_device(base):
+    """Identity and classification of a sysfs input device, or None if there is none"""
+    name = _read(os.path.join(base, "name"), None)
+    if name is None:
+        return None
+    capabilities = {kind: _bitmap(_read(os.path.join(base, "capabilities", kind)))
+                    for kind in ("ev", "key", "rel", "abs")}
+    return {
+        "name": name,
+        "phys": _read(os.path.join(base, "phys")),
+        "uniq": _read(os.path.join(base, "uniq")),
+        "ids": [int(_read(os.path.join(base, "id", field), "0"), 16)
+                for field in ("bustype", "vendor", "product", "version")],
+        "categories": classify(capabilities["ev"], capabilities["key"],
+                               capabilities["rel"], capabilities["abs"]),
+        "key_count": bin(capabilities["key"]).count("1"),
+        "rel_count": bin(capabilities["rel"]).count("1"),
+        "abs_count": bin(capabilities["abs"]).count("1"),
+    }
+
+
+def _describe(path, cache):
+    """(cache key, InputDeviceInfo or None) for /dev/input/eventN"""
+    # /dev/input/by-id/... links resolve to their eventN node
+    event_name = os.path.basename(os.path.realpath(path))
+    key = _node_key(event_name) if cache is not None else None
+    entry = cache.get(key) if key is not None else None
+    if entry is None:
+        entry = _read_device(os.path.join(SYSFS_INPUT, event_name, "device"))
+        if entry is None:
+            return key, None
+        if key is not None:
+            cache[key] = entry
+
+    ids = entry["ids"]
+    identity = "{:04x}:{:04x}:{:04x}:{:04x}:{}:{}:{}".format(*ids, entry["name"], entry["phys"], entry["uniq"])
+    return key, InputDeviceInfo(
+        os.path.join(DEV_INPUT, event_name), identity, entry["name"], entry["phys"], entry["uniq"], *ids,
+        tuple(entry["categories"]), entry["key_count"], entry["rel_count"], entry["abs_count"])
+
+
+def describe_device(path, cache=None):
+    """InputDeviceInfo for /dev/input/eventN from sysfs, or None if it is not an input device
+
+    cache maps device node keys to descriptions; new ones are added to it.
+    """
+    return _describe(path, cache)[1]
+
+
+def load_cache(path):
+    """Cached classifications, or an empty cache if missing or from another version"""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") == CACHE_VERSION:
+            return data.get("devices", {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def save_cache(path, cache):
+    """Write the cache atomically (errors are ignored: it is only a cache)"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"version": CACHE_VERSION, "devices": cache}, f, indent=1)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+
+
+def list_input_devices(cache_path=None):
+    """Every /dev/input/event* device described from sysfs, in event number order"""
+    cache_path = cache_path or default_cache_path()
+    cache = load_cache(cache_path)
+    known = len(cache)
+    try:
+        names = [name for name in os.listdir(SYSFS_INPUT) if name.startswith("event")]
+    except OSError:
+        return []
+
+    devices = []
+    seen = {}
+    for name in sorted(names, key=lambda name: int(name[5:]) if name[5:].isdigit() else 0):
+        key, info = _describe(name, cache)
+        if info is not None:
+            devices.append(info)
+            if key is not None:
+                seen[key] = cache[key]
+
+    # Keep only devices present now, and write only when something changed
+    if len(cache) != known or len(seen) != len(cache):
+        save_cache(cache_path, seen)
+    return devices
+
+
+def keyboards(devices):
+    """The devices classified as keyboards"""
+    return [info for info in devices if "keyboards" in info.categories]
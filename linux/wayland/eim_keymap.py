@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+EIM Keymap
+Precomputed keycode -> character tables for decoding evdev key events
+
+Each layout is compiled once into a flat list indexed by
+keycode * 8 + modifier state, so decoding a key press is a single list
+index. The state bits are Shift, CapsLock and "command" (Ctrl/Alt/Meta held,
+which types no text). CapsLock only affects letters, as in xkb; Shift and
+CapsLock together give lower-case letters.
+
+Keycodes are the kernel's (linux/input-event-codes.h), so the tables do not
+need evdev to be built.
+"""
+
+# Modifier state bits
+SHIFT = 1
+CAPSLOCK = 2
+COMMAND = 4
+STATES = 8
+
+# Every EV_KEY code (KEY_CNT), so any event can be looked up without a bounds check
+KEY_COUNT = 0x300
+
+# Modifier keycodes
+KEY_LEFTSHIFT, KEY_RIGHTSHIFT = 42, 54
+KEY_CAPSLOCK = 58
+COMMAND_KEYS = (
+    29, 97,     # KEY_LEFTCTRL, KEY_RIGHTCTRL
+    56,         # KEY_LEFTALT (AltGr, KEY_RIGHTALT, still types text)
+    125, 126,   # KEY_LEFTMETA, KEY_RIGHTMETA
+)
+MODIFIER_KEYS = (KEY_LEFTSHIFT, KEY_RIGHTSHIFT, KEY_CAPSLOCK) + COMMAND_KEYS
+LED_CAPSL = 1
+
+# Physical key rows: keycodes from left to right
+ROW_NUMBERS = (41, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13)
+ROW_TOP = (16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27)
+ROW_HOME = (30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 43)
+ROW_BOTTOM = (86, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53)
+
+# Per layout: one (unshifted, shifted) string pair per row; "\0" is no character
+LAYOUTS = {
+    "qwerty": (
+        ("`1234567890-=", "~!@#$%^&*()_+"),
+        ("qwertyuiop[]", "QWERTYUIOP{}"),
+        ("asdfghjkl;'\\", "ASDFGHJKL:\"|"),
+        ("\\zxcvbnm,./", "|ZXCVBNM<>?"),
+    ),
+    "dvorak": (
+        ("`1234567890[]", "~!@#$%^&*(){}"),
+        ("',.pyfgcrl/=", "\"<>PYFGCRL?+"),
+        ("aoeuidhtns-\\", "AOEUIDHTNS_|"),
+        ("\\;qjkxbmwvz", "|:QJKXBMWVZ"),
+    ),
+    "azerty": (
+        ("²&é\"'(-è_çà)=", "\0" + "1234567890°+"),
+        ("azertyuiop^$", "AZERTYUIOP¨£"),
+        ("qsdfghjklmù*", "QSDFGHJKLM%µ"),
+        ("<wxcvbn,;:!", ">WXCVBN?./§"),
+    ),
+}
+DEFAULT_LAYOUT = "qwerty"
+
+
+class KeyMap:
+    """Compiled keycode/modifier -> character table for one layout"""
+
+    def __init__(self, layout=DEFAULT_LAYOUT):
+        rows = LAYOUTS.get(layout)
+        if rows is None:
+            raise ValueError(f"Unknown keyboard layout: {layout} "
+                             f"(available: {', '.join(sorted(LAYOUTS))})")
+        self.layout = layout
+        self.chars = [None] * (KEY_COUNT * STATES)
+        # char -> (keycode, shift) for turning text back into key presses
+        self.keystrokes = {}
+
+        for codes, (plain, shifted) in zip((ROW_NUMBERS, ROW_TOP, ROW_HOME, ROW_BOTTOM), rows):
+            for code, normal, upper in zip(codes, plain, shifted):
+                normal = None if normal == "\0" else normal
+                upper = None if upper == "\0" else upper
+                letter = normal is not None and normal.isalpha() and upper == normal.upper()
+                base = code * STATES
+                self.chars[base] = normal
+                self.chars[base | SHIFT] = upper
+                self.chars[base | CAPSLOCK] = upper if letter else normal
+                self.chars[base | SHIFT | CAPSLOCK] = normal if letter else upper
+                # COMMAND states stay None: Ctrl/Alt shortcuts type nothing
+                for char, shift in ((normal, False), (upper, True)):
+                    if char is not None:
+                        self.keystrokes.setdefault(char, (code, shift))
+
+    def key_codes(self):
+        """Every keycode that types a character on this layout"""
+        return {index // STATES for index, char in enumerate(self.chars) if char is not None}
+
+    def char(self, code, state):
+        """Character typed by a keycode in a modifier state, or None"""
+        return self.chars[code * STATES | state]
+
+
+class ModifierState:
+    """Shift / CapsLock / command-key state, kept as table index bits"""
+
+    def __init__(self):
+        self.state = 0
+        self.shift_down = set()
+        self.command_down = set()
+
+    def update(self, code, value):
+        """Apply one key event; True if the key was a modifier"""
+        if code == KEY_LEFTSHIFT or code == KEY_RIGHTSHIFT:
+            self._press(self.shift_down, code, value)
+        elif code in COMMAND_KEYS:
+            self._press(self.command_down, code, value)
+        elif code == KEY_CAPSLOCK:
+            # CapsLock toggles on press; autorepeat (value 2) changes nothing
+            if value == 1:
+                self.state ^= CAPSLOCK
+        else:
+            return False
+        self.state = ((self.state & CAPSLOCK)
+                      | (SHIFT if self.shift_down else 0)
+                      | (COMMAND if self.command_down else 0))
+        return True
+
+    @staticmethod
+    def _press(keys_down, code, value):
+        if value:
+            keys_down.add(code)
+        else:
+            keys_down.discard(code)
+
+    def sync(self, devices):
+        """Start from the keys and LEDs already active on the devices (evdev InputDevices)"""
+        active = set()
+        capslock = 0
+        for device in devices:
+            try:
+                active.update(device.active_keys())
+                if LED_CAPSL in device.leds():
+                    capslock = CAPSLOCK
+            except OSError:
+                # Unplugged; the remaining devices still count
+                continue
+        self.shift_down = {code for code in (KEY_LEFTSHIFT, KEY_RIGHTSHIFT) if code in active}
+        self.command_down = {code for code in COMMAND_KEYS if code in active}
+        self.state = (capslock
+                      | (SHIFT if self.shift_down else 0)
+                      | (COMMAND if self.command_down else 0))
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+EIM Latency Histograms
+Fixed-bucket latency histograms for each stage of an expansion
+
+Recording a sample is a binary search over a fixed list of bucket bounds
+plus one counter increment, so the histograms are cheap enough to stay on
+all the time. Percentiles are reported as the upper bound of the bucket
+they fall in.
+
+StartupTimer breaks the daemon's time-to-ready down into phases.
+"""
+
+import json
+import time
+from bisect import bisect_left
+
+# Bucket upper bounds in milliseconds: 10 per decade from 10 us to 10 s
+BUCKET_BOUNDS_MS = [round(10 ** (exponent / 10), 4) for exponent in range(-20, 41)]
+
+# Stages of one expansion, in the order they happen
+STAGES = ("event_read", "match", "queue_wait", "inject", "total")
+
+
+class LatencyHistogram:
+    """Counts of samples per fixed latency bucket"""
+
+    def __init__(self, bounds=BUCKET_BOUNDS_MS):
+        self.bounds = bounds
+        # The last bucket collects everything above the largest bound
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms):
+        """Add one sample"""
+        self.counts[bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of samples"""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return self.bounds[index] if index < len(self.bounds) else self.max_ms
+        return self.max_ms
+
+    def mean(self):
+        return self.total_ms / self.count if self.count else 0.0
+
+    def to_dict(self):
+        """Summary plus the non-empty buckets, keyed by upper bound in ms"""
+        buckets = {}
+        for index, count in enumerate(self.counts):
+            if count:
+                bound = str(self.bounds[index]) if index < len(self.bounds) else "inf"
+                buckets[bound] = count
+        return {
+            "count": self.count,
+            "mean_ms": self.mean(),
+            "max_ms": self.max_ms,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": buckets,
+        }
+
+
+class LatencyStats:
+    """One histogram per expansion stage"""
+
+    def __init__(self, stages=STAGES):
+        self.histograms = {stage: LatencyHistogram() for stage in stages}
+
+    def record(self, stage, ms):
+        self.histograms[stage].record(ms)
+
+    def summary_lines(self):
+        """One status line per stage that has samples"""
+        lines = []
+        for stage, histogram in self.histograms.items():
+            if histogram.count:
+                lines.append(
+                    f"{stage:>10}: p50 {histogram.percentile(0.50):.2f} ms, "
+                    f"p95 {histogram.percentile(0.95):.2f} ms, "
+                    f"p99 {histogram.percentile(0.99):.2f} ms ({histogram.count} samples)")
+        return lines
+
+    def to_dict(self):
+        return {stage: histogram.to_dict() for stage, histogram in self.histograms.items()}
+
+    def export(self, path):
+        """Write every histogram to a JSON file"""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+class StartupTimer:
+    """Wall time of each startup phase, from one mark to the next"""
+
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self.last = self.start
+        self.phases = []
+
+    def mark(self, phase, now=None):
+        """End the current phase under the given name"""
+        now = time.perf_counter() if now is None else now
+        self.phases.append((phase, (now - self.last) * 1000))
+        self.last = now
+
+    def total_ms(self):
+        return (self.last - self.start) * 1000
+
+    def summary_lines(self):
+        """One line per phase plus the total"""
+        lines = [f"{phase:>16}: {ms:8.1f} ms" for phase, ms in self.phases]
+        lines.append(f"{'ready':>16}: {self.total_ms():8.1f} ms")
+        return lines
+
+    def to_dict(self):
+        phases = {phase: round(ms, 3) for phase, ms in self.phases}
+        phases["total"] = round(self.total_ms(), 3)
+        return phases
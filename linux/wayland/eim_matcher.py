@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+EIM Hotstring Matcher
+Incremental matchers over every hotstring, advanced one keystroke at a time
+
+Supports the AutoHotkey hotstring options used by EIM.ahk:
+- "?" - in-word: the hotstring fires even when it ends another word (":?C:tn::tion")
+- "C" - case-sensitive: without it the trigger matches in any case and the
+  replacement follows the case of what was typed
+
+Whole-word hotstrings live in a prefix trie whose cursor steps one node per
+keystroke and falls into a dead state once the word can no longer match.
+In-word hotstrings use an Aho-Corasick automaton. Every key costs O(1)
+(amortized for the automaton), independent of how many hotstrings are loaded.
+
+Only the triggers are read to build the matcher; a replacement is looked up
+in the expansions mapping when its trigger is typed, so a lazily decoded
+dictionary (the compiled index) is never decoded in full.
+
+The matcher is read-only once built. The word being typed and its cursors
+live in a TypingState, one per keyboard, so keystrokes from different
+devices never mix and any number of them can share one matcher.
+"""
+
+# Options for entries not listed in HOTSTRING_OPTIONS (":C:" in EIM.ahk)
+DEFAULT_OPTIONS = "C"
+
+# Trie node numbers: the dead state has no children, so it absorbs every key
+DEAD = 0
+ROOT = 1
+
+# Cursors before the first character of a word: (case-sensitive trie,
+# case-insensitive trie, case-sensitive automaton, case-insensitive automaton)
+START = (ROOT, ROOT, 0, 0)
+
+
+class PrefixTrie:
+    """Prefix trie over whole-word hotstrings"""
+
+    def __init__(self, hotstrings):
+        # hotstrings: {trigger: abbreviation in the expansions mapping}
+        self.children = [{}, {}]
+        # (trigger, abbreviation) for nodes that spell a complete trigger
+        self.terminal = [None, None]
+
+        for trigger, abbreviation in hotstrings.items():
+            node = ROOT
+            for char in trigger:
+                next_node = self.children[node].get(char)
+                if next_node is None:
+                    next_node = len(self.children)
+                    self.children.append({})
+                    self.terminal.append(None)
+                    self.children[node][char] = next_node
+                node = next_node
+            self.terminal[node] = (trigger, abbreviation)
+
+    def step(self, node, char):
+        """Advance the cursor by one character (DEAD stays DEAD)"""
+        return self.children[node].get(char, DEAD)
+
+
+class HotstringAutomaton:
+    """Aho-Corasick automaton over in-word hotstrings"""
+
+    def __init__(self, hotstrings):
+        # hotstrings: {trigger: abbreviation in the expansions mapping}
+        self.goto = [{}]
+        self.fail = [0]
+        # Longest in-word hotstring that is a suffix of this state
+        self.inword_match = [None]
+
+        for trigger, abbreviation in hotstrings.items():
+            self._add(trigger, abbreviation)
+        self._build_failure_links()
+
+    def _add(self, trigger, abbreviation):
+        state = 0
+        for char in trigger:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.inword_match.append(None)
+                self.goto[state][char] = next_state
+            state = next_state
+        self.inword_match[state] = (trigger, abbreviation)
+
+    def _build_failure_links(self):
+        # Breadth-first so every failure target is finished before it is used
+        queue = list(self.goto[0].values())
+        index = 0
+        while index < len(queue):
+            state = queue[index]
+            index += 1
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                # Inherit the longest in-word match ending here
+                if self.inword_match[next_state] is None:
+                    self.inword_match[next_state] = self.inword_match[self.fail[next_state]]
+
+    def step(self, state, char):
+        """Advance the automaton by one character"""
+        goto = self.goto
+        while True:
+            next_state = goto[state].get(char)
+            if next_state is not None:
+                return next_state
+            if not state:
+                return 0
+            state = self.fail[state]
+
+    def in_word(self, state):
+        """Return the longest in-word (trigger, abbreviation) ending here"""
+        return self.inword_match[state]
+
+
+class TypingState:
+    """The word being typed on one keyboard, with one matcher cursor tuple per character"""
+
+    __slots__ = ("word", "states", "last_key_time")
+
+    def __init__(self):
+        self.last_key_time = 0.0
+        self.reset()
+
+    def reset(self):
+        """Start a new word"""
+        self.word = []
+        # One cursor tuple per typed character, so BackSpace is a single pop
+        self.states = [START]
+
+    def backspace(self):
+        """Undo the last typed character"""
+        if self.word:
+            self.word.pop()
+            self.states.pop()
+
+    def current_word(self):
+        """The characters typed since the last word boundary"""
+        return "".join(self.word)
+
+
+class HotstringMatcher:
+    """Per-keystroke matcher over case-sensitive and case-insensitive hotstrings"""
+
+    def __init__(self, expansions, options=None):
+        options = options or {}
+        # Replacements are looked up here on a match, not copied into the tries
+        self.expansions = expansions
+        whole_word = ({}, {})
+        in_word = ({}, {})
+        for abbreviation in expansions:
+            trigger_options = options.get(abbreviation, DEFAULT_OPTIONS)
+            exact_case = "C" in trigger_options
+            trigger = abbreviation if exact_case else abbreviation.lower()
+            table = in_word if "?" in trigger_options else whole_word
+            table[0 if exact_case else 1][trigger] = abbreviation
+
+        self.case_sensitive_words = PrefixTrie(whole_word[0])
+        self.case_insensitive_words = PrefixTrie(whole_word[1])
+        self.case_sensitive_inword = HotstringAutomaton(in_word[0])
+        self.case_insensitive_inword = HotstringAutomaton(in_word[1])
+        self.pattern_count = sum(len(table) for table in whole_word + in_word)
+
+    def feed(self, typing, char):
+        """Advance every cursor of a TypingState by one typed character"""
+        cs_node, ci_node, cs_state, ci_state = typing.states[-1]
+        lower = char.lower()
+        typing.word.append(char)
+        typing.states.append((
+            self.case_sensitive_words.step(cs_node, char),
+            self.case_insensitive_words.step(ci_node, lower),
+            self.case_sensitive_inword.step(cs_state, char),
+            self.case_insensitive_inword.step(ci_state, lower),
+        ))
+
+    def match(self, typing):
+        """Return (typed_trigger, replacement) for a TypingState's current word, or None"""
+        cs_node, ci_node, cs_state, ci_state = typing.states[-1]
+
+        # Whole-word hotstrings take precedence over in-word suffixes
+        candidates = (
+            (self.case_sensitive_words.terminal[cs_node], True),
+            (self.case_insensitive_words.terminal[ci_node], False),
+            (self.case_sensitive_inword.in_word(cs_state), True),
+            (self.case_insensitive_inword.in_word(ci_state), False),
+        )
+        for found, exact_case in candidates:
+            if not found:
+                continue
+            trigger, abbreviation = found
+            replacement = self.expansions[abbreviation]
+            if exact_case:
+                return trigger, replacement
+            typed = "".join(typing.word[-len(trigger):])
+            return typed, conform_case(typed, replacement)
+        return None
+
+def conform_case(typed, replacement):
+    """Follow the case of the typed trigger, as AutoHotkey does without "C" """
+    letters = [char for char in typed if char.isalpha()]
+    if not letters:
+        return replacement
+    if all(char.isupper() for char in letters) and len(letters) > 1:
+        return replacement.upper()
+    if letters[0].isupper():
+        return replacement[:1].upper() + replacement[1:]
+    return replacement
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EIM Daemon Control Client
+Query and control a running EIM daemon through its control socket
+
+Usage:
+python3 eimctl.py status            # state, counters and latency percentiles
+python3 eimctl.py counters
+python3 eimctl.py history [COUNT]   # recent expansions (default 10)
+python3 eimctl.py devices
+python3 eimctl.py namespaces        # abbreviation counts per namespace
+python3 eimctl.py entries NAME      # every entry in a namespace or source section
+python3 eimctl.py reload            # reload the expansion dictionary
+python3 eimctl.py pause | resume    # stop / restart expanding
+python3 eimctl.py --json status     # raw JSON response
+python3 eimctl.py --socket PATH status
+"""
+
+import json
+import sys
+
+from eim_control import send_command, default_socket_path
+
+
+def print_result(command, result):
+    """Print a response in a readable form"""
+    if command == "history":
+        for entry in result:
+            print(entry)
+    elif command == "devices":
+        for device in result:
+            print(f"{device['path']}: {device['name']}")
+            if "delivered_events" in device:
+                print(f"  {device['key_events']} key events from {device['delivered_events']} delivered "
+                      f"in {device['reads']} reads ({device['frames']} frames, "
+                      f"{device['dropped_frames']} dropped, "
+                      f"kernel filter {'on' if device['kernel_filter'] else 'off'})")
+        if not result:
+            print("No keyboard devices")
+    elif isinstance(result, dict):
+        for key, value in result.items():
+            if isinstance(value, dict):
+                print(f"{key}:")
+                for name, item in value.items():
+                    print(f"  {name}: {item}")
+            else:
+                print(f"{key}: {value}")
+    else:
+        print(result)
+
+
+def main():
+    """Send one command to the daemon"""
+    args = sys.argv[1:]
+    raw = "--json" in args
+    if raw:
+        args.remove("--json")
+    path = None
+    if "--socket" in args:
+        index = args.index("--socket")
+        path = args[index + 1] if index + 1 < len(args) else None
+        del args[index:index + 2]
+
+    if not args:
+        print(__doc__.strip())
+        return 1
+
+    command = args[0]
+    arguments = {}
+    if command == "history" and len(args) > 1:
+        if not args[1].isdigit():
+            print(f"Error: history COUNT must be a whole number, not {args[1]!r}")
+            print("Usage: python3 eimctl.py history [COUNT]")
+            return 2
+        arguments["count"] = int(args[1])
+    elif command == "entries":
+        arguments["namespace"] = " ".join(args[1:])
+
+    try:
+        response = send_command(command, path=path, **arguments)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"Error: EIM daemon is not running (no socket at {path or default_socket_path()})")
+        return 1
+    except Exception as e:
+        print(f"Error talking to the daemon: {e}")
+        return 1
+
+    if raw:
+        print(json.dumps(response, indent=2, ensure_ascii=False))
+    elif response.get("ok"):
+        print_result(command, response.get("result"))
+    else:
+        print(f"Error: {response.get('error')}")
+    return 0 if response.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
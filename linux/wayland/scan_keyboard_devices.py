@@ -6,7 +6,7 @@ Utility to scan and list available keyboard devices for configuration
 
 Requirements:
 - Python 3.6+
-- evdev (Linux input device monitoring)
+- evdev (Linux input device monitoring, used for the access test)
 
 Installation:
 pip3 install evdev
@@ -27,18 +27,12 @@ except ImportError:
     print("Install with: pip3 install evdev")
     sys.exit(1)
 
+from eim_input_devices import list_input_devices
+
 def scan_input_devices():
-    """Scan all available input devices"""
+    """Describe all input devices from sysfs (nothing is opened)"""
     try:
-        devices = []
-        for path in evdev.list_devices():
-            try:
-                device = evdev.InputDevice(path)
-                devices.append(device)
-            except Exception as e:
-                print(f"Warning: Could not open device {path}: {e}")
-        
-        return devices
+        return list_input_devices()
     except Exception as e:
         print(f"Error scanning devices: {e}")
         return []
@@ -54,34 +48,8 @@ def categorize_devices(devices):
     }
     
     for device in devices:
-        try:
-            capabilities = device.capabilities()
-            
-            if evdev.ecodes.EV_KEY in capabilities:
-                # Check if it's primarily a keyboard
-                key_codes = capabilities[evdev.ecodes.EV_KEY]
-                if any(code in key_codes for code in [
-                    evdev.ecodes.KEY_A, evdev.ecodes.KEY_SPACE, 
-                    evdev.ecodes.KEY_ENTER, evdev.ecodes.KEY_BACKSPACE
-                ]):
-                    categories['keyboards'].append(device)
-                else:
-                    categories['other'].append(device)
-            
-            if evdev.ecodes.EV_REL in capabilities:
-                if evdev.ecodes.REL_X in capabilities[evdev.ecodes.EV_REL]:
-                    if evdev.ecodes.REL_Y in capabilities[evdev.ecodes.EV_REL]:
-                        categories['mice'].append(device)
-                    else:
-                        categories['touchpads'].append(device)
-            
-            if evdev.ecodes.EV_ABS in capabilities:
-                if evdev.ecodes.ABS_X in capabilities[evdev.ecodes.EV_ABS]:
-                    categories['gamepads'].append(device)
-            
-        except Exception as e:
-            print(f"Warning: Could not categorize device {device.name}: {e}")
-            categories['other'].append(device)
+        for category in device.categories:
+            categories[category].append(device)
     
     return categories
 
@@ -92,23 +60,19 @@ def print_device_info(device, category):
         print(f"     Path: {device.path}")
         print(f"     Phys: {device.phys}")
         print(f"     Uniq: {device.uniq}")
-        print(f"     Bus: {device.info.bustype}")
-        print(f"     Vendor: {device.info.vendor:04x}")
-        print(f"     Product: {device.info.product:04x}")
+        print(f"     Bus: {device.bustype}")
+        print(f"     Vendor: {device.vendor:04x}")
+        print(f"     Product: {device.product:04x}")
         
         # Show capabilities
-        capabilities = device.capabilities()
-        if evdev.ecodes.EV_KEY in capabilities:
-            key_count = len(capabilities[evdev.ecodes.EV_KEY])
-            print(f"     Keys: {key_count} supported")
+        if device.key_count:
+            print(f"     Keys: {device.key_count} supported")
         
-        if evdev.ecodes.EV_REL in capabilities:
-            rel_count = len(capabilities[evdev.ecodes.EV_REL])
-            print(f"     Relative axes: {rel_count}")
+        if device.rel_count:
+            print(f"     Relative axes: {device.rel_count}")
         
-        if evdev.ecodes.EV_ABS in capabilities:
-            abs_count = len(capabilities[evdev.ecodes.EV_ABS])
-            print(f"     Absolute axes: {abs_count}")
+        if device.abs_count:
+            print(f"     Absolute axes: {device.abs_count}")
         
         print()
         
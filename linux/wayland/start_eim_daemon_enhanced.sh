@@ -15,6 +15,7 @@ BASIC_DAEMON="$SCRIPT_DIR/EIM_autokey_dotool_daemon.py"
 ENHANCED_DAEMON="$SCRIPT_DIR/EIM_autokey_dotool_daemon_evdev.py"
 CONFIG_FILE="$SCRIPT_DIR/eim_config.json"
 DEVICE_SCANNER="$SCRIPT_DIR/scan_keyboard_devices.py"
+CONTROL_CLIENT="$SCRIPT_DIR/eimctl.py"
 
 echo -e "${BLUE}EIM Text Expansion Daemon Enhanced${NC}"
 echo "=========================================="
@@ -28,13 +29,17 @@ check_prerequisites() {
         missing_deps+=("python3")
     fi
     
-    # Check dotool
-    if ! command -v dotool &> /dev/null; then
+    # Check dotool (not needed when typing through a writable /dev/uinput)
+    local backend
+    backend=$(python3 -c "import json; print(json.load(open('$CONFIG_FILE')).get('injection_backend', 'dotool'))" 2>/dev/null)
+    if [ "$backend" = "uinput" ] && [ -w /dev/uinput ]; then
+        echo "Using the uinput injection backend"
+    elif ! command -v dotool &> /dev/null; then
         missing_deps+=("dotool")
     fi
     
-    # Check evdev (optional)
-    if ! python3 -c "import evdev" 2>/dev/null; then
+    # Check evdev (optional); find_spec locates it without paying for the import
+    if ! python3 -c "import importlib.util, sys; sys.exit(importlib.util.find_spec('evdev') is None)" 2>/dev/null; then
         echo -e "${YELLOW}Warning: evdev not available. Install with: pip3 install evdev${NC}"
         echo "Enhanced keyboard monitoring will not be available."
         EVDEV_AVAILABLE=false
@@ -43,7 +48,7 @@ check_prerequisites() {
     fi
     
     # Check clipboard tools
-    if ! command -v wl-clipboard &> /dev/null && ! command -v xclip &> /dev/null; then
+    if ! command -v wl-paste &> /dev/null && ! command -v xclip &> /dev/null; then
         missing_deps+=("wl-clipboard or xclip")
     fi
     
@@ -167,6 +172,9 @@ show_status() {
         # Check which type is running
         if pgrep -f "EIM_autokey_dotool_daemon_evdev" > /dev/null; then
             echo "Type: Enhanced (evdev keyboard monitoring)"
+            echo ""
+            # Live state from the daemon's control socket
+            python3 "$CONTROL_CLIENT" status 2>/dev/null || true
         else
             echo "Type: Basic (clipboard monitoring)"
         fi
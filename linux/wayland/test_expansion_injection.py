@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EIM Expansion Injection Test
+Types an abbreviation through the daemon's key handling and checks the text
+that ends up in the (simulated) application
+
+The injection backend is replaced by one that applies the dotool script to a
+text buffer, so no dotool, uinput or display is needed.
+
+Usage:
+python3 test_expansion_injection.py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import evdev
+
+# The daemon and the shared dictionary live next to / above this script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import EIM_autokey_dotool_daemon_evdev as daemon_module
+from eim_injection import DotoolSession
+from eim_keymap import KEY_LEFTSHIFT
+
+
+class TextBuffer(DotoolSession):
+    """Backend that applies dotool scripts to a string instead of a window"""
+
+    def __init__(self):
+        super().__init__()
+        self.text = ""
+        self.clipboard = ""
+
+    def send(self, commands):
+        for line in commands.splitlines():
+            action, _, argument = line.partition(" ")
+            if action == "type":
+                self.text += argument
+                continue
+            for key in argument.split():
+                if key == "BackSpace":
+                    self.text = self.text[:-1]
+                elif key == "Return":
+                    self.text += "\n"
+                elif key == "ctrl+v":
+                    self.text += self.clipboard
+        self.injections += 1
+        return True
+
+
+class FakePaster:
+    """ClipboardPaster stand-in that puts the expansion on the buffer's clipboard"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.restores = 0
+
+    def prepare(self, text):
+        self.backend.clipboard = text
+        return True
+
+    def schedule_restore(self):
+        self.restores += 1
+
+    def own_change(self):
+        return False
+
+
+class ExpansionInjectionTest(unittest.TestCase):
+    def setUp(self):
+        self.backend = TextBuffer()
+        config_file = os.path.join(tempfile.mkdtemp(), "eim_config.json")
+        with mock.patch.object(daemon_module.EIMDaemonEnhanced, "create_backend", return_value=self.backend), \
+                mock.patch.object(daemon_module.EIMDaemonEnhanced, "initialize_keyboard_devices"), \
+                mock.patch.object(daemon_module.EIMDaemonEnhanced, "save_config"):
+            self.daemon = daemon_module.EIMDaemonEnhanced(config_file)
+        self.daemon.paster = None
+
+    def type_keys(self, text):
+        """Feed key events for text to the daemon, and the typed text to the buffer"""
+        for char in text:
+            if char == " ":
+                code, shift = evdev.ecodes.KEY_SPACE, False
+            elif char == "\n":
+                code, shift = evdev.ecodes.KEY_ENTER, False
+            else:
+                code, shift = self.daemon.keymap.keystrokes[char]
+            keys = [KEY_LEFTSHIFT, code] if shift else [code]
+            for key in keys:
+                self.daemon.process_key_event(evdev.InputEvent(0, 0, evdev.ecodes.EV_KEY, key, 1))
+            for key in reversed(keys):
+                self.daemon.process_key_event(evdev.InputEvent(0, 0, evdev.ecodes.EV_KEY, key, 0))
+            # The keyboard is not grabbed: the application sees the key as well
+            self.backend.text += char
+
+    def inject_queued(self):
+        jobs = []
+        while not self.daemon.expansion_queue.empty():
+            jobs.append(self.daemon.expansion_queue.get_nowait())
+        self.assertTrue(self.daemon.inject_jobs(jobs))
+
+    def test_space_trigger_is_kept(self):
+        self.type_keys("say aomg ")
+        self.inject_queued()
+        self.assertEqual(self.backend.text, "say oh my god ")
+
+    def test_enter_trigger_is_kept(self):
+        self.type_keys("abtw\n")
+        self.inject_queued()
+        self.assertEqual(self.backend.text, "by the way\n")
+
+    def test_pasted_expansion_keeps_trigger(self):
+        self.daemon.paster = FakePaster(self.backend)
+        self.daemon.config["paste_threshold"] = 1
+        self.type_keys("aomg ")
+        self.inject_queued()
+        self.assertEqual(self.backend.text, "oh my god ")
+        self.assertEqual(self.daemon.paster.restores, 1)
+
+    def test_failed_paste_restores_clipboard(self):
+        self.daemon.paster = FakePaster(self.backend)
+        self.daemon.config["paste_threshold"] = 1
+        self.type_keys("aomg ")
+        with mock.patch.object(self.backend, "build_paste", side_effect=KeyError("v")):
+            jobs = [self.daemon.expansion_queue.get_nowait()]
+            with mock.patch("sys.stdout"):
+                self.assertFalse(self.daemon.inject_jobs(jobs))
+        self.assertEqual(self.daemon.paster.restores, 1)
+        self.assertEqual(self.daemon.dropped_expansions, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()